@@ -0,0 +1,14 @@
+import os
+import tempfile
+
+# Benchmarks don't connect to the network nodes, settings just have to be valid.
+# The database is a temporary file unless `DATABASE` is set,
+# benchmarks refuse to fill existing databases.
+os.environ.setdefault('NETWORK', 'hoodi')
+os.environ.setdefault('SIGNATURE_THRESHOLD', '3')
+os.environ.setdefault('EXECUTION_ENDPOINT', 'http://localhost:8545')
+os.environ.setdefault('CONSENSUS_ENDPOINT', 'http://localhost:5052')
+if 'DATABASE' not in os.environ:
+    os.environ['DATABASE'] = os.path.join(
+        tempfile.mkdtemp(prefix='dvt-relayer-bench-'), 'relayer.db'
+    )
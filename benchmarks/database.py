@@ -0,0 +1,66 @@
+"""
+Measures per-call latency of network validators queries
+with a new connection per call and with the persistent connection.
+
+Usage: `python -m benchmarks.database --validators 1000000`
+"""
+import secrets
+import timeit
+from typing import Callable
+
+import click
+from eth_typing import BlockNumber
+from web3 import Web3
+
+from benchmarks.utils import use_new_database
+from src.common.clients import db_client
+from src.config import settings
+from src.validators.database import NetworkValidatorCrud
+from src.validators.typings import NetworkValidator
+
+
+def with_new_connection(query: Callable) -> Callable:
+    """Closes connections of the shared `db_client`, so the query opens a new one."""
+
+    def wrapper() -> object:
+        db_client.close()
+        return query()
+
+    return wrapper
+
+
+@click.command()
+@click.option('--validators', type=int, default=100_000, show_default=True)
+@click.option('--calls', type=int, default=1000, show_default=True)
+def main(validators: int, calls: int) -> None:
+    use_new_database(settings.database)
+    crud = NetworkValidatorCrud()
+    crud.setup()
+    crud.save_network_validators(
+        [
+            NetworkValidator(
+                public_key=Web3.to_hex(secrets.token_bytes(48)),
+                block_number=BlockNumber(i // 10),
+            )
+            for i in range(validators)
+        ]
+    )
+    latest_public_keys = [Web3.to_hex(secrets.token_bytes(48)) for _ in range(10)]
+    click.echo(f'{validators} network validators, {calls} calls per query')
+
+    queries = {
+        'get_last_network_validator': crud.get_last_network_validator,
+        'get_next_validator_index': lambda: crud.get_next_validator_index(latest_public_keys),
+    }
+    for name, wrap in (
+        ('connection per call', with_new_connection),
+        ('persistent connection', lambda query: query),
+    ):
+        for query_name, query in queries.items():
+            elapsed = timeit.timeit(wrap(query), number=calls)
+            click.echo(f'{name}: {query_name} {elapsed / calls * 1e6:.1f} us per call')
+    db_client.close()
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,74 @@
+"""
+Measures validators journal cost per `/exit-signature` request:
+appending operator's shares and reconstructed exit signatures.
+
+Usage: `python -m benchmarks.journal --validators 10 --requests 1000`
+"""
+import os
+import secrets
+import tempfile
+import time
+
+import click
+from eth_typing import BLSSignature, HexStr
+
+from src.validators.journal import ValidatorsJournal
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+
+@click.command()
+@click.option('--validators', type=int, default=10, show_default=True)
+@click.option('--requests', type=int, default=1000, show_default=True)
+@click.option('--oracles', type=int, default=11, show_default=True)
+def main(validators: int, requests: int, oracles: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix='dvt-relayer-bench-'), 'validators.journal')
+    journal = ValidatorsJournal()
+    journal.setup(path, validator_lifetime=3600, compaction_records=requests * validators * 3)
+
+    now = int(time.time())
+    batches = []
+    for _ in range(requests):
+        batch = [
+            Validator(
+                public_key=HexStr('0x' + secrets.token_hex(48)),
+                validator_index=i,
+                created_at=now,
+                exit_signature=BLSSignature(secrets.token_bytes(96)),
+                oracles_exit_signature_shares=OraclesExitSignatureShares(
+                    public_keys=[HexStr('0x' + secrets.token_hex(48)) for _ in range(oracles)],
+                    encrypted_exit_signatures=[
+                        HexStr('0x' + secrets.token_hex(193)) for _ in range(oracles)
+                    ],
+                ),
+            )
+            for i in range(validators)
+        ]
+        journal.add_validators(batch)
+        batches.append(batch)
+
+    share = BLSSignature(secrets.token_bytes(96))
+    shares_elapsed = exit_signatures_elapsed = 0.0
+    for batch in batches:
+        start = time.perf_counter()
+        journal.add_exit_signature_shares((v.public_key, 1, share) for v in batch)
+        shares_elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+        journal.add_exit_signatures(batch)
+        exit_signatures_elapsed += time.perf_counter() - start
+
+    click.echo(f'{requests} requests, {validators} validators per request, {oracles} oracles')
+    click.echo(f'exit signature shares: {shares_elapsed / requests * 1e6:.1f} us per request')
+    click.echo(f'exit signatures: {exit_signatures_elapsed / requests * 1e6:.1f} us per request')
+
+    start = time.perf_counter()
+    journal.compact(v for batch in batches for v in batch)
+    click.echo(
+        f'compaction of {requests * validators} validators: '
+        f'{time.perf_counter() - start:.2f} s, journal size {os.path.getsize(path) / 2**20:.1f} MiB'
+    )
+    journal.close()
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,69 @@
+"""
+Compares share polynomial evaluation against the straightforward evaluation
+with full-size scalar multiplications.
+
+Usage: `python -m benchmarks.key_shares --threshold 8 --total 11`
+"""
+import random
+import timeit
+
+import click
+from py_ecc.optimized_bls12_381.optimized_curve import (
+    G1,
+    G2,
+    add,
+    curve_order,
+    multiply,
+)
+
+from src.validators.key_shares import get_G12_polynomial_points
+
+
+def get_G12_polynomial_points_reference(coefficients: list, num_points: int) -> list:
+    points = []
+    for x in range(1, num_points + 1):
+        y = coefficients[0]
+        for i in range(1, len(coefficients)):
+            y = add(y, multiply(coefficients[i], (x**i) % curve_order))
+        points.append(y)
+    return points
+
+
+@click.command()
+@click.option('--threshold', type=int, default=8, show_default=True)
+@click.option('--total', type=int, default=11, show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+def main(threshold: int, total: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    coefficients_int = [rng.randrange(1, curve_order) for _ in range(threshold)]
+
+    benchmark_group('G1', [multiply(G1, c) for c in coefficients_int], total, repeat)
+    benchmark_group('G2', [multiply(G2, c) for c in coefficients_int], total, repeat)
+
+
+def benchmark_group(group_name: str, coefficients: list, total: int, repeat: int) -> None:
+    reference = min(
+        timeit.repeat(
+            lambda: get_G12_polynomial_points_reference(coefficients, total),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    current = min(
+        timeit.repeat(
+            lambda: get_G12_polynomial_points(coefficients, total),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    click.echo(
+        f'{group_name} threshold={len(coefficients)} total={total}: '
+        f'reference {reference * 1000:.1f} ms, '
+        f'horner {current * 1000:.1f} ms, '
+        f'speedup x{reference / current:.1f}'
+    )
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,268 @@
+"""
+Load generator for a running relayer.
+Vaults register new validators with `POST /validators` and poll it until the exit signatures
+are ready. DVT operators poll `GET /exits` for validators missing their shares,
+sign the exit messages with their private key shares and post them to `/exit-signature`.
+Reports throughput and p50/p99 latency per endpoint and the time until exit signatures are ready.
+
+Point the relayer to the stand-in nodes (`benchmarks.stand_in_nodes`) and run the relayer
+and the load generator with the same env. Operators and signature threshold are taken from
+`SIGNATURE_THRESHOLD` env, every operator signs with its own share index starting from 1.
+
+Usage: `python -m benchmarks.load_generator --vaults 10 --validators-per-vault 5 --operators 4`
+"""
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+import click
+import milagro_bls_binding as bls
+from eth_typing import HexStr
+from py_ecc.optimized_bls12_381.optimized_curve import curve_order
+from web3 import Web3
+
+from src.config import settings
+from src.validators.exit_messages import exit_message_cache
+
+
+@dataclass
+class Stats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def report(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+        return {
+            'requests': len(latencies),
+            'errors': self.errors,
+            'throughput': len(latencies) / elapsed,
+            'p50': percentile(latencies, 0.5),
+            'p99': percentile(latencies, 0.99),
+        }
+
+
+def percentile(sorted_values: list[float], q: float) -> float | None:
+    if not sorted_values:
+        return None
+    return sorted_values[min(int(q * len(sorted_values)), len(sorted_values) - 1)]
+
+
+class KeyShares:
+    """Validator keys split to the operators' private key shares, indexes are 1-based."""
+
+    def __init__(self, rng: random.Random, threshold: int, operators: int) -> None:
+        self.rng = rng
+        self.threshold = threshold
+        self.operators = operators
+        self.shares: dict[HexStr, list[bytes]] = {}
+
+    def create(self) -> HexStr:
+        coefficients = [self.rng.randrange(1, curve_order) for _ in range(self.threshold)]
+        public_key = Web3.to_hex(bls.SkToPk(coefficients[0].to_bytes(32, 'big')))
+        self.shares[public_key] = [
+            self._evaluate(coefficients, index).to_bytes(32, 'big')
+            for index in range(1, self.operators + 1)
+        ]
+        return public_key
+
+    def sign(self, public_key: HexStr, share_index: int, message: bytes) -> HexStr:
+        return Web3.to_hex(bls.Sign(self.shares[public_key][share_index - 1], message))
+
+    @staticmethod
+    def _evaluate(coefficients: list[int], x: int) -> int:
+        y = 0
+        for coefficient in reversed(coefficients):
+            y = (y * x + coefficient) % curve_order
+        return y
+
+
+# pylint: disable-next=too-many-instance-attributes
+class LoadGenerator:
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        *,
+        session: aiohttp.ClientSession,
+        relayer_url: str,
+        key_shares: KeyShares,
+        validators_per_vault: int,
+        rounds: int,
+        poll_interval: float,
+        timeout: float,
+    ) -> None:
+        self.session = session
+        self.relayer_url = relayer_url.rstrip('/')
+        self.key_shares = key_shares
+        self.validators_per_vault = validators_per_vault
+        self.rounds = rounds
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.stats = {
+            'POST /validators': Stats(),
+            'GET /exits': Stats(),
+            'POST /exit-signature': Stats(),
+        }
+        self.time_to_ready = Stats()
+        self.stopped = asyncio.Event()
+
+    async def request(self, name: str, method: str, path: str, **kwargs: object) -> dict | None:
+        stats = self.stats[name]
+        start = time.perf_counter()
+        try:
+            async with self.session.request(
+                method, f'{self.relayer_url}{path}', **kwargs  # type: ignore[arg-type]
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            stats.errors += 1
+            return None
+        stats.latencies.append(time.perf_counter() - start)
+        return data
+
+    async def run_vault(self) -> None:
+        for _ in range(self.rounds):
+            public_keys = [self.key_shares.create() for _ in range(self.validators_per_vault)]
+            start = time.perf_counter()
+            while time.perf_counter() - start < self.timeout:
+                data = await self.request(
+                    'POST /validators', 'POST', '/validators', json={'public_keys': public_keys}
+                )
+                if data and data['ready']:
+                    self.time_to_ready.latencies.append(time.perf_counter() - start)
+                    break
+                await asyncio.sleep(self.poll_interval)
+            else:
+                self.time_to_ready.errors += 1
+
+    async def run_operator(self, share_index: int) -> None:
+        while not self.stopped.is_set():
+            data = await self.request(
+                'GET /exits',
+                'GET',
+                '/exits',
+                params={'is_ready': 'false', 'missing_share_index': share_index},
+            )
+            shares = [
+                {
+                    'public_key': exit_['public_key'],
+                    'exit_signature': self.key_shares.sign(
+                        exit_['public_key'],
+                        share_index,
+                        exit_message_cache.get(exit_['validator_index']).signing_root,
+                    ),
+                }
+                for exit_ in (data['exits'] if data else [])
+                if exit_['public_key'] in self.key_shares.shares
+            ]
+            if shares:
+                await self.request(
+                    'POST /exit-signature',
+                    'POST',
+                    '/exit-signature',
+                    json={'share_index': share_index, 'shares': shares},
+                )
+                continue
+            try:
+                await asyncio.wait_for(self.stopped.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def run(
+    vaults: int, operators: int, **generator_kwargs: object
+) -> tuple[float, LoadGenerator]:
+    connector = aiohttp.TCPConnector(limit=vaults + operators)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        generator = LoadGenerator(session=session, **generator_kwargs)  # type: ignore[arg-type]
+
+        async def run_vaults() -> None:
+            await asyncio.gather(*(generator.run_vault() for _ in range(vaults)))
+            generator.stopped.set()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            run_vaults(),
+            *(generator.run_operator(share_index) for share_index in range(1, operators + 1)),
+        )
+        return time.perf_counter() - start, generator
+
+
+@click.command()
+@click.option(
+    '--relayer-url',
+    default=f'http://{settings.relayer_host}:{settings.relayer_port}',
+    show_default=True,
+)
+@click.option('--vaults', type=int, default=10, show_default=True)
+@click.option('--validators-per-vault', type=int, default=5, show_default=True)
+@click.option('--operators', type=int, default=4, show_default=True)
+@click.option('--rounds', type=int, default=10, show_default=True, help='Requests per vault.')
+@click.option('--poll-interval', type=float, default=1, show_default=True)
+@click.option('--timeout', type=float, default=60, show_default=True, help='Seconds per round.')
+@click.option('--output', type=click.Path(dir_okay=False), help='JSON file for the results.')
+@click.option('--seed', type=int, default=0, show_default=True)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def main(
+    relayer_url: str,
+    vaults: int,
+    validators_per_vault: int,
+    operators: int,
+    rounds: int,
+    poll_interval: float,
+    timeout: float,
+    output: str | None,
+    seed: int,
+) -> None:
+    if operators < settings.signature_threshold:
+        raise click.BadParameter(
+            f'at least {settings.signature_threshold} operators are required',
+            param_hint='operators',
+        )
+
+    elapsed, generator = asyncio.run(
+        run(
+            vaults,
+            operators,
+            relayer_url=relayer_url,
+            key_shares=KeyShares(random.Random(seed), settings.signature_threshold, operators),
+            validators_per_vault=validators_per_vault,
+            rounds=rounds,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+    )
+
+    results = {name: stats.report(elapsed) for name, stats in generator.stats.items()}
+    results['exit signatures ready'] = generator.time_to_ready.report(elapsed)
+    click.echo(
+        f'{vaults} vaults, {validators_per_vault} validators per request, '
+        f'{operators} operators, {elapsed:.1f} s'
+    )
+    for name, result in results.items():
+        click.echo(f'{name}: {format_result(result)}')
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'seed': seed, 'elapsed': elapsed, 'results': results}, f, indent=2)
+        click.echo(f'Results saved to {output}')
+
+
+def format_result(result: dict) -> str:
+    return (
+        f'{result["requests"]} ok, {result["errors"]} errors, {result["throughput"]:.1f}/s, '
+        f'p50 {format_seconds(result["p50"])}, p99 {format_seconds(result["p99"])}'
+    )
+
+
+def format_seconds(value: float | None) -> str:
+    if value is None:
+        return '-'
+    return f'{value * 1e3:.1f} ms'
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
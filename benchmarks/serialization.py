@@ -0,0 +1,108 @@
+"""
+Compares `/exits` and `POST /validators` responses serialization:
+pydantic models with FastAPI's JSON encoder against cached response items.
+
+Usage: `python -m benchmarks.serialization --validators 10000`
+"""
+import secrets
+import time
+import timeit
+
+import click
+from eth_typing import BLSSignature, HexStr
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.validators import serialization
+from src.validators.schema import (
+    CreateValidatorsResponse,
+    CreateValidatorsResponseItem,
+    ExitsResponse,
+    ExitsResponseItem,
+)
+from src.validators.serialization import (
+    serialize_create_validators_response,
+    serialize_exits_response,
+)
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+
+def create_validators(count: int, oracles: int) -> list[Validator]:
+    now = int(time.time())
+    return [
+        Validator(
+            public_key=HexStr('0x' + secrets.token_hex(48)),
+            validator_index=i,
+            created_at=now,
+            exit_signature=BLSSignature(secrets.token_bytes(96)),
+            exit_signature_shares={j: BLSSignature(secrets.token_bytes(96)) for j in range(4)},
+            oracles_exit_signature_shares=OraclesExitSignatureShares(
+                public_keys=[HexStr('0x' + secrets.token_hex(48)) for _ in range(oracles)],
+                encrypted_exit_signatures=[
+                    HexStr('0x' + secrets.token_hex(193)) for _ in range(oracles)
+                ],
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def pydantic_exits(validators: list[Validator]) -> bytes:
+    response = ExitsResponse(exits=[ExitsResponseItem.from_validator(v) for v in validators])
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def pydantic_create_validators(validators: list[Validator]) -> bytes:
+    response = CreateValidatorsResponse(
+        ready=True,
+        validators=[CreateValidatorsResponseItem.from_validator(v) for v in validators],
+    )
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def measure(name: str, validators: list[Validator], calls: int) -> None:
+    for v in validators:
+        v.response_fragments.clear()
+    cold = timeit.timeit(
+        lambda: (
+            serialize_exits_response(validators, None, 0, []),
+            serialize_create_validators_response(True, validators),
+        ),
+        number=1,
+    )
+    exits_time = timeit.timeit(
+        lambda: serialize_exits_response(validators, None, 0, []), number=calls
+    )
+    validators_time = timeit.timeit(
+        lambda: serialize_create_validators_response(True, validators), number=calls
+    )
+    click.echo(
+        f'{name}: first responses {cold * 1e3:.1f} ms, then /exits '
+        f'{exits_time / calls * 1e3:.1f} ms, '
+        f'POST /validators {validators_time / calls * 1e3:.1f} ms'
+    )
+
+
+@click.command()
+@click.option('--validators', type=int, default=10_000, show_default=True)
+@click.option('--oracles', type=int, default=11, show_default=True)
+@click.option('--calls', type=int, default=20, show_default=True)
+def main(validators: int, oracles: int, calls: int) -> None:
+    items = create_validators(validators, oracles)
+    click.echo(f'{validators} validators, {oracles} oracles')
+
+    exits_time = timeit.timeit(lambda: pydantic_exits(items), number=calls)
+    validators_time = timeit.timeit(lambda: pydantic_create_validators(items), number=calls)
+    click.echo(
+        f'pydantic: /exits {exits_time / calls * 1e3:.1f} ms, '
+        f'POST /validators {validators_time / calls * 1e3:.1f} ms'
+    )
+
+    if serialization.ORJSON_INSTALLED:
+        measure('cached items, orjson', items, calls)
+    serialization.ORJSON_INSTALLED = False
+    measure('cached items, json', items, calls)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
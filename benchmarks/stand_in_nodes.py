@@ -0,0 +1,358 @@
+"""
+Stand-in execution node, consensus node and IPFS gateway for the load generator.
+Serves on one port:
+
+* execution JSON-RPC on `/`: blocks, `DepositEvent` logs with valid deposit signatures
+  and `ConfigUpdated` log of the oracles config
+* beacon API on `/eth/...`: finality checkpoints and blocks, finalized head trails the chain head
+* IPFS gateway on `/ipfs/{hash}`: the oracles config and genesis validators dump
+
+A new block is produced every `--block-time` seconds.
+Run it with the relayer's env and point the relayer to it: set `EXECUTION_ENDPOINT`,
+`CONSENSUS_ENDPOINT` and `IPFS_FETCH_ENDPOINTS` to `http://127.0.0.1:{port}`.
+
+Usage: `python -m benchmarks.stand_in_nodes --port 8545 --genesis-validators 100000`
+"""
+import hashlib
+import json
+import random
+import time
+from typing import Any
+
+import click
+import milagro_bls_binding as bls
+from aiohttp import web
+from coincurve import PrivateKey
+from eth_abi import encode
+from py_ecc.optimized_bls12_381.optimized_curve import curve_order
+from web3 import Web3
+
+from src.config import settings
+
+CONFIG_IPFS_HASH = 'QmStandInOraclesConfig'
+
+DEPOSIT_EVENT_TOPIC = Web3.to_hex(Web3.keccak(text='DepositEvent(bytes,bytes,bytes,bytes,bytes)'))
+CONFIG_UPDATED_EVENT_TOPIC = Web3.to_hex(Web3.keccak(text='ConfigUpdated(string)'))
+
+DOMAIN_DEPOSIT = bytes.fromhex('03000000')
+DEPOSIT_AMOUNT_GWEI = 32 * 10**9
+ZERO_HASH = b'\x00' * 32
+
+
+def get_deposit_signing_root(
+    public_key: bytes, withdrawal_credentials: bytes, amount_gwei: int, fork_version: bytes
+) -> bytes:
+    """SSZ signing root of `DepositMessage` in the deposit domain."""
+    sha256 = hashlib.sha256
+    public_key_root = sha256(public_key[:32] + public_key[32:].ljust(32, b'\x00')).digest()
+    amount = amount_gwei.to_bytes(8, 'little').ljust(32, b'\x00')
+    message_root = sha256(
+        sha256(public_key_root + withdrawal_credentials).digest()
+        + sha256(amount + ZERO_HASH).digest()
+    ).digest()
+    fork_data_root = sha256(fork_version.ljust(32, b'\x00') + ZERO_HASH).digest()
+    domain = DOMAIN_DEPOSIT + fork_data_root[:28]
+    return sha256(message_root + domain).digest()
+
+
+def build_oracles_config(rng: random.Random, oracles: int, threshold: int) -> dict:
+    return {
+        'oracles': [
+            {
+                'public_key': '0x'
+                + PrivateKey(rng.randbytes(32)).public_key.format(compressed=False).hex(),
+                'endpoints': [f'http://oracle-{i}.invalid'],
+            }
+            for i in range(oracles)
+        ],
+        'exit_signature_recover_threshold': threshold,
+        'rewards_threshold': threshold,
+        'validators_threshold': threshold,
+        'exit_signature_epoch': 0,
+        'signature_validity_period': 60,
+        'until_force_exit_epochs': 1261,
+        'validators_approval_batch_limit': 100,
+        'validators_exit_rotation_batch_limit': 10,
+    }
+
+
+# pylint: disable-next=too-many-instance-attributes
+class StandInNodes:
+    # finalized epoch trails the chain head by two epochs
+    FINALIZED_DISTANCE_EPOCHS = 2
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        genesis_validators: int,
+        deposits_per_block: int,
+        oracles_config: dict,
+        block_time: float,
+        seed: int,
+    ) -> None:
+        self.deposits_per_block = deposits_per_block
+        self.oracles_config = oracles_config
+        self.block_time = block_time
+        self.seed = seed
+        self.slots_per_epoch = settings.network_config.SLOTS_PER_EPOCH
+        self.start_block = max(
+            settings.network_config.KEEPER_GENESIS_BLOCK,
+            self.slots_per_epoch * (self.FINALIZED_DISTANCE_EPOCHS + 1),
+        )
+        self.start_time = time.time()
+        self._deposit_logs: dict[int, list[dict]] = {}
+
+        rng = random.Random(seed)
+        genesis_block = (self.start_block - 1).to_bytes(4, 'big')
+        self.genesis_validators = b''.join(
+            genesis_block + rng.randbytes(48) for _ in range(genesis_validators)
+        )
+
+    @property
+    def head(self) -> int:
+        return self.start_block + int((time.time() - self.start_time) / self.block_time)
+
+    @property
+    def finalized_epoch(self) -> int:
+        return self.head // self.slots_per_epoch - self.FINALIZED_DISTANCE_EPOCHS
+
+    @property
+    def finalized(self) -> int:
+        """The last slot of the finalized epoch."""
+        return (self.finalized_epoch + 1) * self.slots_per_epoch - 1
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 2**20)
+        app.router.add_post('/', self.handle_rpc)
+        app.router.add_get(
+            '/eth/v1/beacon/states/{state_id}/finality_checkpoints', self.handle_checkpoints
+        )
+        app.router.add_get('/eth/v2/beacon/blocks/{block_id}', self.handle_beacon_block)
+        app.router.add_get('/ipfs/{ipfs_hash}', self.handle_ipfs)
+        return app
+
+    async def handle_rpc(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self.call_rpc(p) for p in payload])
+        return web.json_response(self.call_rpc(payload))
+
+    def call_rpc(self, payload: dict) -> dict:
+        method, params = payload['method'], payload.get('params', [])
+        response: dict[str, Any] = {'jsonrpc': '2.0', 'id': payload.get('id')}
+        if method == 'eth_blockNumber':
+            response['result'] = hex(self.head)
+        elif method == 'eth_getBlockByNumber':
+            response['result'] = self.get_block(self.get_block_number(params[0]))
+        elif method == 'eth_getLogs':
+            response['result'] = self.get_logs(params[0])
+        else:
+            response['error'] = {'code': -32601, 'message': f'method {method} is not supported'}
+        return response
+
+    def get_block_number(self, block_id: str) -> int:
+        if block_id in ('latest', 'pending'):
+            return self.head
+        if block_id in ('finalized', 'safe'):
+            return self.finalized
+        if block_id == 'earliest':
+            return self.start_block
+        return int(block_id, 16)
+
+    def get_block(self, number: int) -> dict | None:
+        if number > self.head:
+            return None
+        return {
+            'number': hex(number),
+            'hash': block_hash(number),
+            'parentHash': block_hash(number - 1),
+            'timestamp': hex(int(self.start_time + (number - self.start_block) * self.block_time)),
+            'miner': '0x' + '00' * 20,
+            'gasLimit': hex(30_000_000),
+            'gasUsed': '0x0',
+            'baseFeePerGas': hex(10**9),
+            'extraData': '0x',
+            'logsBloom': '0x' + '00' * 256,
+            'transactions': [],
+            'uncles': [],
+        }
+
+    def get_logs(self, log_filter: dict) -> list[dict]:
+        from_block = self.get_block_number(log_filter.get('fromBlock', 'latest'))
+        to_block = min(self.get_block_number(log_filter.get('toBlock', 'latest')), self.head)
+        addresses = log_filter.get('address') or []
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        addresses = {a.lower() for a in addresses}
+        topics = log_filter.get('topics') or [None]
+
+        network_config = settings.network_config
+        logs: list[dict] = []
+        keeper_address = network_config.KEEPER_CONTRACT_ADDRESS.lower()
+        if (
+            keeper_address in addresses
+            and topics[0] in (None, CONFIG_UPDATED_EVENT_TOPIC)
+            and from_block <= self.start_block <= to_block
+        ):
+            logs.append(
+                create_log(
+                    keeper_address,
+                    CONFIG_UPDATED_EVENT_TOPIC,
+                    encode(['string'], [CONFIG_IPFS_HASH]),
+                    self.start_block,
+                    0,
+                )
+            )
+
+        registry_address = network_config.VALIDATORS_REGISTRY_CONTRACT_ADDRESS.lower()
+        if registry_address in addresses and topics[0] in (None, DEPOSIT_EVENT_TOPIC):
+            for number in range(max(from_block, self.start_block + 1), to_block + 1):
+                logs.extend(self.get_deposit_logs(number))
+        return logs
+
+    def get_deposit_logs(self, number: int) -> list[dict]:
+        if number not in self._deposit_logs:
+            rng = random.Random(f'{self.seed}-{number}')
+            fork_version = settings.network_config.GENESIS_FORK_VERSION
+            registry_address = settings.network_config.VALIDATORS_REGISTRY_CONTRACT_ADDRESS
+            logs = []
+            for i in range(self.deposits_per_block):
+                private_key = rng.randrange(1, curve_order).to_bytes(32, 'big')
+                public_key = bls.SkToPk(private_key)
+                withdrawal_credentials = b'\x01' + b'\x00' * 11 + rng.randbytes(20)
+                signing_root = get_deposit_signing_root(
+                    public_key, withdrawal_credentials, DEPOSIT_AMOUNT_GWEI, fork_version
+                )
+                data = encode(
+                    ['bytes'] * 5,
+                    [
+                        public_key,
+                        withdrawal_credentials,
+                        DEPOSIT_AMOUNT_GWEI.to_bytes(8, 'little'),
+                        bls.Sign(private_key, signing_root),
+                        (number * self.deposits_per_block + i).to_bytes(8, 'little'),
+                    ],
+                )
+                logs.append(create_log(registry_address, DEPOSIT_EVENT_TOPIC, data, number, i))
+            self._deposit_logs[number] = logs
+        return self._deposit_logs[number]
+
+    async def handle_checkpoints(self, request: web.Request) -> web.Response:
+        del request
+        checkpoint = {'epoch': str(self.finalized_epoch), 'root': block_hash(self.finalized)}
+        return web.json_response(
+            {
+                'data': {
+                    'previous_justified': checkpoint,
+                    'current_justified': checkpoint,
+                    'finalized': checkpoint,
+                }
+            }
+        )
+
+    async def handle_beacon_block(self, request: web.Request) -> web.Response:
+        """Slots and execution blocks have the same numbers."""
+        block_id = request.match_info['block_id']
+        if block_id == 'head':
+            slot = self.head
+        elif block_id == 'finalized':
+            slot = self.finalized
+        elif block_id.isdigit():
+            slot = int(block_id)
+        else:
+            raise web.HTTPBadRequest()
+        if not 0 <= slot <= self.head:
+            raise web.HTTPNotFound()
+
+        return web.json_response(
+            {
+                'version': 'deneb',
+                'execution_optimistic': False,
+                'finalized': slot <= self.finalized,
+                'data': {
+                    'message': {
+                        'slot': str(slot),
+                        'proposer_index': '0',
+                        'parent_root': block_hash(slot - 1),
+                        'state_root': block_hash(slot),
+                        'body': {
+                            'execution_payload': {
+                                'block_number': str(slot),
+                                'block_hash': block_hash(slot),
+                                'timestamp': str(int(self.start_time)),
+                            }
+                        },
+                    }
+                },
+            }
+        )
+
+    async def handle_ipfs(self, request: web.Request) -> web.Response:
+        if request.match_info['ipfs_hash'] == CONFIG_IPFS_HASH:
+            return web.json_response(self.oracles_config)
+        return web.Response(body=self.genesis_validators, content_type='application/octet-stream')
+
+
+def block_hash(number: int) -> str:
+    return Web3.to_hex(Web3.keccak(number.to_bytes(32, 'big')))
+
+
+def create_log(address: str, topic: str, data: bytes, number: int, log_index: int) -> dict:
+    return {
+        'address': Web3.to_checksum_address(address),
+        'topics': [topic],
+        'data': Web3.to_hex(data),
+        'blockNumber': hex(number),
+        'blockHash': block_hash(number),
+        'transactionHash': Web3.to_hex(Web3.keccak(text=f'{number}-{log_index}')),
+        'transactionIndex': hex(log_index),
+        'logIndex': hex(log_index),
+        'removed': False,
+    }
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True)
+@click.option('--port', type=int, default=8545, show_default=True)
+@click.option('--genesis-validators', type=int, default=100_000, show_default=True)
+@click.option('--deposits-per-block', type=int, default=1, show_default=True)
+@click.option('--oracles', type=int, default=11, show_default=True)
+@click.option('--oracles-threshold', type=int, default=8, show_default=True)
+@click.option(
+    '--oracles-config',
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSON file to serve instead of the generated oracles config.',
+)
+@click.option('--block-time', type=float, default=None, help='Defaults to the network block time.')
+@click.option('--seed', type=int, default=0, show_default=True)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def main(
+    host: str,
+    port: int,
+    genesis_validators: int,
+    deposits_per_block: int,
+    oracles: int,
+    oracles_threshold: int,
+    oracles_config: str | None,
+    block_time: float | None,
+    seed: int,
+) -> None:
+    if oracles_config:
+        with open(oracles_config, encoding='utf-8') as f:
+            config = json.load(f)
+    else:
+        config = build_oracles_config(random.Random(seed), oracles, oracles_threshold)
+
+    nodes = StandInNodes(
+        genesis_validators=genesis_validators,
+        deposits_per_block=deposits_per_block,
+        oracles_config=config,
+        block_time=block_time or settings.network_config.SECONDS_PER_BLOCK,
+        seed=seed,
+    )
+    click.echo(f'Stand-in nodes start at block {nodes.start_block}')
+    web.run_app(nodes.create_app(), host=host, port=port, print=None)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
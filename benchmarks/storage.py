@@ -0,0 +1,97 @@
+"""
+Compares network validators stored with hex string and binary public keys:
+database size, insert throughput and membership query latency.
+Also measures migration of the hex string table.
+
+Usage: `python -m benchmarks.storage --validators 1000000`
+"""
+import os
+import secrets
+import sqlite3
+import time
+import timeit
+
+import click
+from eth_typing import BlockNumber, HexStr
+
+from benchmarks.utils import use_new_database
+from src.common.clients import db_client
+from src.config import settings
+from src.validators.database import NetworkValidatorCrud
+
+BATCH_SIZE = 10_000
+
+
+def get_database_size(path: str) -> int:
+    with sqlite3.connect(path) as conn:
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    return os.path.getsize(path)
+
+
+def measure_queries(conn: sqlite3.Connection, table: str, params: list, calls: int) -> None:
+    exists_query = f'SELECT EXISTS(SELECT 1 FROM {table} WHERE public_key = ?)'
+    elapsed = timeit.timeit(
+        lambda: [conn.execute(exists_query, (p,)).fetchone() for p in params], number=calls
+    )
+    click.echo(f'  EXISTS lookup: {elapsed / calls / len(params) * 1e6:.1f} us per key')
+
+    not_in_query = (
+        f'SELECT COUNT(*) FROM (SELECT ? AS public_key {"UNION ALL SELECT ? " * (len(params) - 1)})'
+        f' WHERE public_key NOT IN (SELECT public_key FROM {table})'
+    )
+    elapsed = timeit.timeit(lambda: conn.execute(not_in_query, params).fetchone(), number=calls)
+    click.echo(f'  NOT IN query for {len(params)} keys: {elapsed / calls * 1e6:.1f} us')
+
+
+@click.command()
+@click.option('--validators', type=int, default=100_000, show_default=True)
+@click.option('--calls', type=int, default=1000, show_default=True)
+def main(validators: int, calls: int) -> None:
+    crud = NetworkValidatorCrud()
+    table = crud.NETWORK_VALIDATORS_TABLE
+    rows = [(secrets.token_bytes(48), BlockNumber(i // 10)) for i in range(validators)]
+    hex_rows = [(HexStr('0x' + key.hex()), block_number) for key, block_number in rows]
+    latest_public_keys = [HexStr('0x' + secrets.token_hex(48)) for _ in range(5)] + [
+        hex_rows[i][0] for i in range(0, validators, validators // 5)
+    ]
+    click.echo(f'{validators} network validators')
+
+    # hex strings, the table layout before binary public keys
+    text_path = settings.database
+    use_new_database(text_path)
+    with sqlite3.connect(text_path) as conn:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            f'CREATE TABLE {table} (public_key VARCHAR(98) UNIQUE NOT NULL, '
+            'block_number INTEGER NOT NULL)'
+        )
+        start = time.perf_counter()
+        for i in range(0, validators, BATCH_SIZE):
+            conn.executemany(f'INSERT INTO {table} VALUES(?, ?)', hex_rows[i : i + BATCH_SIZE])
+            conn.commit()
+        elapsed = time.perf_counter() - start
+        click.echo(f'hex strings: {validators / elapsed:.0f} inserts/s')
+        click.echo(f'  database size: {get_database_size(text_path) / 2**20:.1f} MiB')
+        measure_queries(conn, table, latest_public_keys, calls)
+
+    crud.setup()
+    start = time.perf_counter()
+    crud.apply_migrations(is_deferred=True)
+    click.echo(f'migration: {time.perf_counter() - start:.2f} s')
+
+    # binary public keys in a new database
+    use_new_database(os.path.join(os.path.dirname(text_path), 'relayer-blob.db'))
+    crud.setup()
+    start = time.perf_counter()
+    for i in range(0, validators, BATCH_SIZE):
+        crud.save_network_validator_rows(rows[i : i + BATCH_SIZE])
+    elapsed = time.perf_counter() - start
+    db_client.close()
+    click.echo(f'binary: {validators / elapsed:.0f} inserts/s')
+    click.echo(f'  database size: {get_database_size(settings.database) / 2**20:.1f} MiB')
+    with sqlite3.connect(settings.database) as conn:
+        measure_queries(conn, table, [bytes.fromhex(key[2:]) for key in latest_public_keys], calls)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,284 @@
+"""
+Microbenchmarks of the crypto and storage hot paths.
+Keys and data are synthetic, every benchmark generates them from the same fixed seed.
+Results are saved as JSON, pass the file of another commit to `--baseline` to compare.
+
+Deposit signatures are valid points but don't sign the deposit messages:
+verification does the same work and fails.
+
+Usage:
+`python -m benchmarks.suite --output $(git rev-parse --short HEAD).json --baseline main.json`
+"""
+import asyncio
+import functools
+import json
+import platform
+import random
+import statistics
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+import click
+from coincurve import PrivateKey
+from eth_typing import BlockNumber, BLSPubkey, BLSSignature, HexStr
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.optimized_bls12_381.optimized_curve import curve_order
+from web3 import Web3
+
+from benchmarks.utils import use_new_database
+from src.common.clients import db_client
+from src.common.process_pool import process_pool
+from src.config import settings
+from src.validators.bls_backends import get_bls_backend
+from src.validators.database import NetworkValidatorCrud
+from src.validators.execution import verify_network_validator_events
+from src.validators.exit_messages import exit_message_cache
+from src.validators.exit_signature import (
+    encrypt_signatures_list,
+    hash_exit_messages,
+    init_crypto_worker,
+    validate_exit_signatures,
+)
+from src.validators.genesis import (
+    GENESIS_VALIDATOR_RECORD_SIZE,
+    parse_genesis_validators,
+)
+from src.validators.key_shares import (
+    bls_signature_and_public_key_to_shares,
+    reconstruct_shared_bls_signature,
+)
+
+BATCH_SIZE = 10_000
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    params: dict
+    # seconds per call, best and median of the repeats
+    best: float
+    median: float
+
+    @property
+    def key(self) -> str:
+        return f'{self.name} {json.dumps(self.params, sort_keys=True)}'
+
+
+class Suite:
+    def __init__(self, repeat: int, baseline: dict[str, float]) -> None:
+        self.repeat = repeat
+        self.baseline = baseline
+        self.results: list[BenchmarkResult] = []
+
+    def run(self, name: str, func: Callable, number: int = 1, **params: object) -> None:
+        timings = [t / number for t in timeit.repeat(func, number=number, repeat=self.repeat)]
+        result = BenchmarkResult(
+            name=name, params=params, best=min(timings), median=statistics.median(timings)
+        )
+        self.results.append(result)
+
+        line = f'{result.key}: {result.best * 1e3:.3f} ms'
+        if baseline := self.baseline.get(result.key):
+            line += f' ({(result.best / baseline - 1) * 100:+.1f}% vs baseline)'
+        click.echo(line)
+
+
+def bls_keypair(rng: random.Random) -> tuple[int, BLSPubkey]:
+    private_key = rng.randrange(1, curve_order)
+    return private_key, G2ProofOfPossession.SkToPk(private_key)
+
+
+def benchmark_key_shares(suite: Suite, rng: random.Random, configs: list[tuple[int, int]]) -> None:
+    backend = get_bls_backend(settings.bls_backend)
+    private_key, public_key = bls_keypair(rng)
+    message = rng.randbytes(32)
+    signature = G2ProofOfPossession.Sign(private_key, message)
+    max_total = max(total for _, total in configs)
+    oracle_public_keys = [
+        HexStr(PrivateKey(rng.randbytes(32)).public_key.format(compressed=False).hex())
+        for _ in range(max_total)
+    ]
+
+    for threshold, total in configs:
+        signature_shares, _ = bls_signature_and_public_key_to_shares(
+            message, signature, public_key, threshold, total, backend=backend
+        )
+        params: dict = {'threshold': threshold, 'total': total, 'backend': backend.name}
+        suite.run(
+            'bls_signature_and_public_key_to_shares',
+            functools.partial(
+                bls_signature_and_public_key_to_shares,
+                message,
+                signature,
+                public_key,
+                threshold,
+                total,
+                backend=backend,
+            ),
+            **params,
+        )
+        suite.run(
+            'reconstruct_shared_bls_signature',
+            functools.partial(
+                reconstruct_shared_bls_signature,
+                {i + 1: signature_shares[i] for i in range(threshold)},
+                backend=backend,
+            ),
+            **params,
+        )
+        suite.run(
+            'encrypt_signatures_list',
+            functools.partial(
+                encrypt_signatures_list, oracle_public_keys[:total], signature_shares
+            ),
+            **params,
+        )
+
+
+def benchmark_exit_signatures(suite: Suite, rng: random.Random, validators: int) -> None:
+    public_keys: list[HexStr] = []
+    exit_signatures: list[BLSSignature] = []
+    # exit messages and their G2 hashes are cached in the relayer too
+    exit_messages = [
+        exit_message_cache.get(validator_index) for validator_index in range(validators)
+    ]
+    for exit_message in exit_messages:
+        private_key, public_key = bls_keypair(rng)
+        public_keys.append(Web3.to_hex(public_key))
+        exit_signatures.append(G2ProofOfPossession.Sign(private_key, exit_message.signing_root))
+    signing_roots = [m.signing_root for m in exit_messages]
+    messages_g2 = hash_exit_messages(signing_roots)
+    suite.run(
+        'validate_exit_signatures',
+        functools.partial(
+            validate_exit_signatures, public_keys, signing_roots, messages_g2, exit_signatures
+        ),
+        validators=validators,
+        backend=get_bls_backend(settings.bls_backend).name,
+    )
+
+
+def benchmark_deposit_events(suite: Suite, rng: random.Random, events_count: int) -> None:
+    events = []
+    for i in range(events_count):
+        private_key, public_key = bls_keypair(rng)
+        events.append(
+            {
+                'args': {
+                    'pubkey': public_key,
+                    'withdrawal_credentials': rng.randbytes(32),
+                    'signature': G2ProofOfPossession.Sign(private_key, rng.randbytes(32)),
+                    'amount': (32 * 10**9).to_bytes(8, 'little'),
+                },
+                'blockNumber': i,
+            }
+        )
+
+    # chunks are verified across the process pool as in the relayer
+    process_pool.setup(settings.process_pool_size, initializer=init_crypto_worker)
+    try:
+        asyncio.run(process_pool.warm_up())
+        suite.run(
+            'verify_network_validator_events',
+            lambda: asyncio.run(verify_network_validator_events(events)),  # type: ignore[arg-type]
+            events=events_count,
+            chunk_size=settings.deposit_verification_chunk_size,
+            process_pool_size=settings.process_pool_size,
+        )
+    finally:
+        process_pool.shutdown()
+
+
+def benchmark_genesis_parsing(suite: Suite, rng: random.Random, validators: int) -> None:
+    data = memoryview(rng.randbytes(validators * GENESIS_VALIDATOR_RECORD_SIZE))
+    suite.run(
+        'parse_genesis_validators', lambda: parse_genesis_validators(data), validators=validators
+    )
+
+
+def benchmark_database(suite: Suite, rng: random.Random, validators: int) -> None:
+    use_new_database(settings.database)
+    crud = NetworkValidatorCrud()
+    crud.setup()
+    crud.apply_migrations(is_deferred=True)
+
+    rows = [(rng.randbytes(48), BlockNumber(i // 10)) for i in range(validators)]
+    for i in range(0, validators, BATCH_SIZE):
+        crud.save_network_validator_rows(rows[i : i + BATCH_SIZE])
+    saved_public_keys = [HexStr('0x' + rows[rng.randrange(validators)][0].hex()) for _ in range(5)]
+    new_public_keys = [HexStr('0x' + rng.randbytes(48).hex()) for _ in range(5)]
+
+    params: dict = {'validators': validators}
+    suite.run('get_last_network_validator', crud.get_last_network_validator, number=100, **params)
+    suite.run(
+        'get_next_validator_index',
+        lambda: crud.get_next_validator_index(saved_public_keys + new_public_keys),
+        number=100,
+        **params,
+    )
+    db_client.close()
+
+
+@click.command()
+@click.option('--output', type=click.Path(dir_okay=False), help='JSON file for the results.')
+@click.option(
+    '--baseline', type=click.Path(exists=True, dir_okay=False), help='Results to compare.'
+)
+@click.option(
+    '--configs',
+    default='4/7,8/11,11/16',
+    show_default=True,
+    help='Comma separated threshold/oracles pairs.',
+)
+@click.option('--validators', type=int, default=1_000_000, show_default=True)
+@click.option('--exit-signatures', type=int, default=100, show_default=True)
+@click.option('--events', type=int, default=10, show_default=True)
+@click.option('--repeat', type=int, default=5, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def main(
+    output: str | None,
+    baseline: str | None,
+    configs: str,
+    validators: int,
+    exit_signatures: int,
+    events: int,
+    repeat: int,
+    seed: int,
+) -> None:
+    baseline_results = {}
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            baseline_results = {
+                BenchmarkResult(**r).key: r['best'] for r in json.load(f)['results']
+            }
+
+    suite = Suite(repeat, baseline_results)
+    threshold_totals = [
+        (int(threshold), int(total))
+        for threshold, total in (config.split('/') for config in configs.split(','))
+    ]
+    benchmark_key_shares(suite, random.Random(seed), threshold_totals)
+    benchmark_exit_signatures(suite, random.Random(seed), exit_signatures)
+    benchmark_deposit_events(suite, random.Random(seed), events)
+    benchmark_genesis_parsing(suite, random.Random(seed), validators)
+    benchmark_database(suite, random.Random(seed), validators)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'seed': seed,
+                    'repeat': repeat,
+                    'python': platform.python_version(),
+                    'results': [asdict(r) for r in suite.results],
+                },
+                f,
+                indent=2,
+            )
+        click.echo(f'Results saved to {output}')
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
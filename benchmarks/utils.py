@@ -0,0 +1,17 @@
+import os
+
+import click
+
+from src.common.clients import db_client
+from src.config import settings
+
+
+def use_new_database(path: str) -> None:
+    """
+    Points `settings.database` to the path and reconnects the shared `db_client`.
+    Benchmarks fill the database with synthetic validators, existing files are refused.
+    """
+    if os.path.exists(path):
+        raise click.ClickException(f'{path} exists, benchmarks require a new database file')
+    db_client.close()
+    settings.database = path
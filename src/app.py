@@ -10,17 +10,28 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 
 from src.app_state import AppState
+from src.common import metrics
+from src.common.clients import db_client
 from src.common.endpoints import router as common_router
+from src.common.process_pool import process_pool
 from src.common.setup_logging import setup_logging, setup_sentry
+from src.common.tasks import HeadScheduler
 from src.common.utils import get_project_version
 from src.config import settings
+from src.protocol_config.database import OraclesCacheCrud
 from src.protocol_config.tasks import ProtocolConfigTask, update_protocol_config
-from src.validators.database import NetworkValidatorCrud
+from src.validators.bls_backends import get_bls_backend
+from src.validators.database import AsyncNetworkValidatorCrud
 from src.validators.endpoints import router as validators_router
+from src.validators.exit_signature import init_crypto_worker
+from src.validators.journal import validators_journal
+from src.validators.store import ValidatorsStore
 from src.validators.tasks import (
     CleanupValidatorsTask,
+    NetworkValidatorsTailTask,
     NetworkValidatorsTask,
     load_genesis_validators,
+    load_validators_snapshot,
 )
 
 setup_logging()
@@ -36,25 +47,48 @@ async def lifespan(app_instance: FastAPI) -> AsyncIterator:
 
     app_state = AppState()
 
-    app_state.validators = {}
-
-    NetworkValidatorCrud().setup()
+    app_state.validators = ValidatorsStore()
+    if settings.validators_journal_file:
+        restored_validators = validators_journal.setup(
+            settings.validators_journal_file,
+            validator_lifetime=settings.VALIDATOR_LIFETIME,
+            compaction_records=settings.validators_journal_compaction_records,
+        )
+        app_state.validators.load(restored_validators.values())
+
+    logger.info('Using %s BLS backend', get_bls_backend(settings.bls_backend).name)
+    process_pool.setup(settings.process_pool_size, initializer=init_crypto_worker)
+    await process_pool.warm_up()
+
+    await AsyncNetworkValidatorCrud().setup()
+    await db_client.write(OraclesCacheCrud().setup)
+    await load_validators_snapshot()
     await load_genesis_validators()
 
     logger.info('Fetching protocol config...')
     await update_protocol_config()
     logger.info('Protocol config is ready')
 
+    head_scheduler = HeadScheduler()
+    head_scheduler.subscribe(ProtocolConfigTask())
+    head_scheduler.subscribe(NetworkValidatorsTask())
+    head_scheduler.subscribe(NetworkValidatorsTailTask())
+
     # Note: we create a strong references to the tasks. Helps to avoid garbage collecting.
-    protocol_config_task = asyncio.create_task(ProtocolConfigTask().run())
-    network_validators_task = asyncio.create_task(NetworkValidatorsTask().run())
+    head_scheduler_task = asyncio.create_task(head_scheduler.run())
     cleanup_validators_task = asyncio.create_task(CleanupValidatorsTask().run())
+    # indexes are created after genesis validators are loaded, reads don't wait for them
+    migrations_task = asyncio.create_task(AsyncNetworkValidatorCrud().apply_deferred_migrations())
 
     yield
 
-    protocol_config_task.cancel()
-    network_validators_task.cancel()
+    head_scheduler_task.cancel()
     cleanup_validators_task.cancel()
+    migrations_task.cancel()
+
+    validators_journal.close()
+    process_pool.shutdown()
+    db_client.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -77,6 +111,11 @@ async def log_request_processing_time(request: Request, call_next: Callable) ->
     finally:
         elapsed = time() - start
         logger.info('Request processing time for path %s is %.1f', request.url.path, elapsed)
+        # route template, unmatched paths are not labelled to keep labels bounded
+        route = request.scope.get('route')
+        metrics.request_duration.labels(
+            request.method, route.path if route else 'unmatched'
+        ).observe(elapsed)
 
 
 app.include_router(validators_router)
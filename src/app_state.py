@@ -1,11 +1,12 @@
-from eth_typing import HexStr
 from sw_utils import ProtocolConfig
 
 from src.common.typings import OraclesCache, Singleton
-from src.validators.typings import Validator
+from src.validators.store import ValidatorsStore
+from src.validators.typings import NetworkValidatorsTail
 
 
 class AppState(metaclass=Singleton):
     oracles_cache: OraclesCache | None = None
     protocol_config: ProtocolConfig
-    validators: dict[HexStr, Validator]
+    validators: ValidatorsStore
+    network_validators_tail: NetworkValidatorsTail | None = None
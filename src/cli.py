@@ -0,0 +1,58 @@
+"""
+Network validators snapshot commands.
+
+Usage: `python src/cli.py export-validators --file validators.snapshot`
+"""
+from pathlib import Path
+
+import click
+
+from src.common.clients import db_client
+from src.common.setup_logging import setup_logging
+from src.validators.database import NetworkValidatorCrud
+from src.validators.snapshot import (
+    export_validators_snapshot,
+    import_validators_snapshot,
+)
+
+
+@click.group()
+def cli() -> None:
+    setup_logging()
+    NetworkValidatorCrud().setup()
+
+
+@cli.command('export-validators')
+@click.option('--file', 'path', type=click.Path(dir_okay=False, path_type=Path), required=True)
+def export_validators(path: Path) -> None:
+    """Exports network validators to the snapshot file."""
+    header = export_validators_snapshot(path)
+    db_client.close()
+    click.echo(
+        f'Exported {header.validators_count} validators '
+        f'up to block {header.last_block_number} to {path}'
+    )
+
+
+@cli.command('import-validators')
+@click.option(
+    '--file',
+    'path',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+)
+def import_validators(path: Path) -> None:
+    """Imports network validators from the snapshot file to the empty database."""
+    if NetworkValidatorCrud().get_last_network_validator() is not None:
+        raise click.ClickException('Network validators table is not empty')
+
+    header = import_validators_snapshot(path)
+    db_client.close()
+    click.echo(
+        f'Imported {header.validators_count} validators '
+        f'up to block {header.last_block_number} from {path}'
+    )
+
+
+if __name__ == '__main__':
+    cli()
@@ -1,10 +1,21 @@
+import asyncio
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sqlite3 import Connection
+from typing import Any, Callable, TypeVar
 
+from prometheus_client import Histogram
 from sw_utils import IpfsFetchClient, get_consensus_client, get_execution_client
 
+from src.common import metrics
 from src.config import settings
 
+T = TypeVar('T')
+
+# pages, sqlite default
+DEFAULT_WAL_AUTOCHECKPOINT = 1000
+
 execution_client = get_execution_client(
     [settings.execution_endpoint],
     timeout=settings.execution_timeout,
@@ -18,8 +29,92 @@ consensus_client = get_consensus_client(
 
 
 class Database:
+    """
+    Keeps one long-lived connection per thread.
+    Connections use WAL journal mode, so readers don't wait for the writer.
+    Statements are prepared once and reused from the connection's statement cache.
+
+    Async code runs queries with `read` and `write`:
+    writes are serialized in the single writer thread,
+    reads run in the separate threads and never wait behind a long write batch.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._connections: list[Connection] = []
+        self._lock = threading.Lock()
+        self._read_executor: ThreadPoolExecutor | None = None
+        self._write_executor: ThreadPoolExecutor | None = None
+
+    async def read(self, func: Callable[..., T], *args: Any) -> T:
+        if self._read_executor is None:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=settings.database_read_threads, thread_name_prefix='db-read'
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._read_executor, _observe, metrics.sqlite_read_duration, func, *args
+        )
+
+    async def write(self, func: Callable[..., T], *args: Any) -> T:
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-write')
+        return await asyncio.get_running_loop().run_in_executor(
+            self._write_executor, _observe, metrics.sqlite_write_duration, func, *args
+        )
+
     def get_db_connection(self) -> Connection:
-        return sqlite3.connect(settings.database)
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        for executor in (self._read_executor, self._write_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._read_executor = self._write_executor = None
+
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def set_bulk_load(self, enabled: bool) -> None:
+        """
+        Bulk load skips fsync and WAL checkpoints until it is disabled.
+        Applies to the connection of the calling thread, run it with `write`.
+        """
+        conn = self.get_db_connection()
+        if enabled:
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute('PRAGMA wal_autocheckpoint=0')
+            return
+
+        conn.execute(f'PRAGMA synchronous={settings.database_synchronous}')
+        conn.execute(f'PRAGMA wal_autocheckpoint={DEFAULT_WAL_AUTOCHECKPOINT}')
+        # move loaded pages to the database file and shrink the WAL
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def _connect(self) -> Connection:
+        conn = sqlite3.connect(
+            settings.database,
+            cached_statements=settings.database_cached_statements,
+            check_same_thread=False,
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f'PRAGMA synchronous={settings.database_synchronous}')
+        conn.execute(f'PRAGMA cache_size={settings.database_cache_size}')
+        conn.execute(f'PRAGMA mmap_size={settings.database_mmap_size}')
+        return conn
+
+
+def _observe(histogram: Histogram, func: Callable[..., T], *args: Any) -> T:
+    with histogram.time():
+        return func(*args)
 
 
 db_client = Database()
@@ -1,6 +1,7 @@
 import json
 import os
 from functools import cached_property
+from typing import Any
 
 from eth_typing import BlockNumber
 from web3.contract import AsyncContract
@@ -11,7 +12,9 @@ from web3.contract.async_contract import (
 )
 from web3.types import ChecksumAddress, EventData
 
+from src.common import metrics
 from src.common.clients import execution_client
+from src.common.event_windows import find_last_event
 from src.config import settings
 
 
@@ -47,18 +50,31 @@ class ContractWrapper:
         to_block: BlockNumber,
         argument_filters: dict | None = None,
     ) -> EventData | None:
-        blocks_range = self.events_blocks_range_interval
-
-        while to_block >= from_block:
-            events = await event.get_logs(
-                from_block=BlockNumber(max(to_block - blocks_range, from_block)),
-                to_block=to_block,
+        """Fetches the newest event, see `find_last_event`."""
+
+        async def get_logs(
+            window_from_block: BlockNumber, window_to_block: BlockNumber
+        ) -> list[EventData]:
+            return await get_event_logs(
+                event,
+                from_block=window_from_block,
+                to_block=window_to_block,
                 argument_filters=argument_filters,
             )
-            if events:
-                return events[-1]
-            to_block = BlockNumber(to_block - blocks_range - 1)
-        return None
+
+        return await find_last_event(
+            get_logs,
+            from_block=from_block,
+            to_block=to_block,
+            blocks_range=self.events_blocks_range_interval,
+            concurrency=settings.events_scan_concurrency,
+        )
+
+
+async def get_event_logs(event: type[AsyncContractEvent], **kwargs: Any) -> list[EventData]:
+    """Fetches event logs, observes the request time."""
+    with metrics.get_logs_duration.time():
+        return list(await event.get_logs(**kwargs))
 
 
 class ValidatorsRegistryContract(ContractWrapper):
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from src.common.schema import InfoResponse
 from src.config import settings
@@ -9,3 +10,8 @@ router = APIRouter()
 @router.get('/info')
 async def get_info() -> InfoResponse:
     return InfoResponse(network=settings.network)
+
+
+@router.get('/metrics', include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
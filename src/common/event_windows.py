@@ -0,0 +1,78 @@
+"""
+Search of the newest event in block windows.
+Independent of the contracts and settings, logs are fetched by the given function.
+"""
+import asyncio
+from typing import Awaitable, Callable
+
+from eth_typing import BlockNumber
+from web3.exceptions import Web3RPCError
+from web3.types import EventData
+
+# windows grow up to this number of initial windows while they are empty
+MAX_BLOCKS_RANGE_MULTIPLIER = 16
+
+# messages of the providers' errors for too wide `eth_getLogs` requests
+RANGE_LIMIT_ERRORS = (
+    'query returned more than',
+    'too many',
+    'block range',
+    'response size',
+    'limit exceeded',
+    'range is too large',
+)
+
+GetLogs = Callable[[BlockNumber, BlockNumber], Awaitable[list[EventData]]]
+
+
+async def find_last_event(
+    get_logs: GetLogs,
+    from_block: BlockNumber,
+    to_block: BlockNumber,
+    blocks_range: int,
+    concurrency: int,
+) -> EventData | None:
+    """
+    Searches windows from the newest to the oldest, `concurrency` windows at a time.
+    Windows grow while they are empty and shrink on the provider's range limit errors.
+    Older windows are checked only if all newer windows are empty,
+    so the newest event is always returned.
+    """
+    max_blocks_range = blocks_range * MAX_BLOCKS_RANGE_MULTIPLIER
+
+    while to_block >= from_block:
+        windows: list[tuple[BlockNumber, BlockNumber]] = []
+        window_to_block = to_block
+        while window_to_block >= from_block and len(windows) < concurrency:
+            window_from_block = BlockNumber(max(window_to_block - blocks_range, from_block))
+            windows.append((window_from_block, window_to_block))
+            window_to_block = BlockNumber(window_from_block - 1)
+
+        results = await asyncio.gather(
+            *(
+                get_logs(window_from_block, window_to_block)
+                for window_from_block, window_to_block in windows
+            ),
+            return_exceptions=True,
+        )
+        for (window_from_block, _), events in zip(windows, results):
+            if isinstance(events, BaseException):
+                if not is_range_limit_error(events) or blocks_range == 0:
+                    raise events
+                # retry from the failed window, wider windows will fail again
+                blocks_range //= 2
+                max_blocks_range = blocks_range
+                break
+            if events:
+                return events[-1]
+            to_block = BlockNumber(window_from_block - 1)
+        else:
+            blocks_range = min(blocks_range * 2, max_blocks_range)
+    return None
+
+
+def is_range_limit_error(e: BaseException) -> bool:
+    if not isinstance(e, (Web3RPCError, ValueError)):
+        return False
+    message = str(e).lower()
+    return any(error in message for error in RANGE_LIMIT_ERRORS)
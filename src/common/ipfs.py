@@ -0,0 +1,36 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from src.common.clients import ipfs_fetch_client
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_json(ipfs_hash: str) -> Any:
+    """
+    Fetches JSON from IPFS.
+    Content of IPFS hash never changes, so fetched files are kept in `IPFS_CACHE_DIR`.
+    """
+    path = _get_cache_path(ipfs_hash)
+    if path is not None and path.exists():
+        return json.loads(path.read_bytes())
+
+    data = await ipfs_fetch_client.fetch_json(ipfs_hash)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.tmp')
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_path, path)
+        logger.debug('Saved %s to the IPFS cache', ipfs_hash)
+    return data
+
+
+def _get_cache_path(ipfs_hash: str) -> Path | None:
+    # hash is used as file name
+    if not settings.ipfs_cache_dir or not ipfs_hash.isalnum():
+        return None
+    return Path(settings.ipfs_cache_dir) / ipfs_hash
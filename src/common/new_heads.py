@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Callable
+
+from eth_typing import BlockNumber
+from web3 import AsyncWeb3, WebSocketProvider
+
+logger = logging.getLogger(__name__)
+
+
+class NewHeadsSubscription:
+    """
+    Subscribes to `newHeads` of the execution node over WebSocket
+    and calls `on_new_head` with the number of every new block.
+    Reconnects with exponential backoff when the connection is lost.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        on_new_head: Callable[[BlockNumber], None],
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.on_new_head = on_new_head
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.is_subscribed = False
+
+    async def run(self) -> None:
+        reconnect_delay = self.reconnect_delay
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.endpoint)) as w3:
+                    await w3.eth.subscribe('newHeads')
+                    self.is_subscribed = True
+                    reconnect_delay = self.reconnect_delay
+                    logger.info('Subscribed to new heads of the execution node')
+
+                    async for message in w3.socket.process_subscriptions():
+                        self.on_new_head(_get_block_number(message['result']))
+            except Exception as e:
+                logger.warning(
+                    'New heads subscription failed: %s, reconnecting in %.0f s',
+                    repr(e),
+                    reconnect_delay,
+                )
+            finally:
+                self.is_subscribed = False
+
+            await asyncio.sleep(reconnect_delay)
+            reconnect_delay = min(reconnect_delay * 2, self.max_reconnect_delay)
+
+
+def _get_block_number(head: dict) -> BlockNumber:
+    number = head['number']
+    if isinstance(number, str):
+        return BlockNumber(int(number, 16))
+    return BlockNumber(number)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class ProcessPool:
+    """
+    Runs CPU-bound functions in worker processes, so the event loop is not blocked.
+    When the pool is disabled functions are called in the event loop thread.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self.size = 0
+
+    def setup(self, size: int, initializer: Callable[[], None] | None = None) -> None:
+        if size <= 0:
+            logger.info('Process pool is disabled')
+            return
+
+        logger.info('Starting process pool with %d workers...', size)
+        self._executor = ProcessPoolExecutor(
+            max_workers=size,
+            # don't fork the process with running event loop and threads
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=initializer,
+        )
+        self.size = size
+
+    async def warm_up(self) -> None:
+        """Starts all workers, so the first requests don't wait for processes to spawn."""
+        if self._executor is None:
+            return
+
+        await asyncio.gather(*(self.run(time.sleep, 0.1) for _ in range(self.size)))
+        logger.info('Process pool is ready')
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._executor is None:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def run_timed(self, func: Callable[..., T], *args: Any) -> tuple[T, float]:
+        """Returns the result and the time of the call, waiting for a free worker excluded."""
+        return await self.run(_timed, func, *args)
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self.size = 0
+        logger.info('Process pool is stopped')
+
+
+def _timed(func: Callable[..., T], *args: Any) -> tuple[T, float]:
+    start_time = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start_time
+
+
+process_pool = ProcessPool()
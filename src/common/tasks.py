@@ -2,25 +2,174 @@ import asyncio
 import logging
 import time
 
+from eth_typing import BlockNumber
+
+from src.common import metrics
+from src.common.clients import execution_client
+from src.common.consensus import get_chain_finalized_head
+from src.common.new_heads import NewHeadsSubscription
+from src.common.typings import ChainHeads
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
 
 class BaseTask:
-    async def process_block(self) -> None:
+    async def process_block(self, chain_heads: ChainHeads) -> None:
+        raise NotImplementedError
+
+    def process_unchanged_heads(self, chain_heads: ChainHeads) -> None:
+        """Called when the heads are polled successfully but haven't changed."""
+
+
+class PeriodicTask:
+    """Runs every `interval` seconds, independently of the chain heads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.name = type(self).__name__
+
+    async def process(self) -> None:
         raise NotImplementedError
 
     async def run(self) -> None:
         while True:
             start_time = time.time()
             try:
-                await self.process_block()
+                await self.process()
             except Exception as exc:
                 logger.exception(exc)
 
-            block_processing_time = time.time() - start_time
-            sleep_time = max(
-                float(settings.network_config.SECONDS_PER_BLOCK) - block_processing_time, 0
+            duration = time.time() - start_time
+            metrics.task_duration.labels(self.name).observe(duration)
+            await asyncio.sleep(max(self.interval - duration, 0))
+
+
+class TaskSubscription:
+    """
+    Runs the task for the latest chain heads.
+    Heads received while the task is busy are replaced by the newer ones.
+    """
+
+    def __init__(self, task: BaseTask) -> None:
+        self.task = task
+        self.name = type(task).__name__
+        self.chain_heads: ChainHeads | None = None
+        # duration of the last run and delay between fetching its heads and its end
+        self.duration = 0.0
+        self.lag = 0.0
+        self._updated = asyncio.Event()
+
+    def notify(self, chain_heads: ChainHeads) -> None:
+        self.chain_heads = chain_heads
+        self._updated.set()
+
+    async def run(self) -> None:
+        while True:
+            await self._updated.wait()
+            self._updated.clear()
+            chain_heads = self.chain_heads
+            if chain_heads is None:
+                continue
+
+            start_time = time.time()
+            try:
+                await self.task.process_block(chain_heads)
+            except Exception as exc:
+                logger.exception(exc)
+
+            self.duration = time.time() - start_time
+            self.lag = time.time() - chain_heads.fetched_at
+            metrics.task_duration.labels(self.name).observe(self.duration)
+            metrics.task_lag.labels(self.name).set(self.lag)
+            logger.debug(
+                '%s processed block %d in %.2f s, lag %.2f s',
+                self.name,
+                chain_heads.execution_block_number,
+                self.duration,
+                self.lag,
             )
-            await asyncio.sleep(sleep_time)
+            if self.lag > settings.network_config.SECONDS_PER_BLOCK:
+                logger.warning('%s is behind the chain head, lag %.1f s', self.name, self.lag)
+
+
+class HeadScheduler:
+    """
+    Polls consensus finalized head and execution head once per block
+    and passes new heads to the subscribed tasks.
+    Tasks run concurrently, slow task doesn't delay the others.
+
+    With `EXECUTION_WS_ENDPOINT` heads are polled as soon as the execution node
+    announces a new block, polling once per block remains as a fallback.
+    """
+
+    def __init__(self) -> None:
+        self.subscriptions: list[TaskSubscription] = []
+        self.chain_heads: ChainHeads | None = None
+        self._new_head = asyncio.Event()
+
+    def on_new_head(self, block_number: BlockNumber) -> None:
+        if self.chain_heads is None or block_number > self.chain_heads.execution_block_number:
+            self._new_head.set()
+
+    def subscribe(self, task: BaseTask) -> None:
+        self.subscriptions.append(TaskSubscription(task))
+
+    async def run(self) -> None:
+        # strong references to the tasks, helps to avoid garbage collecting
+        subscription_tasks = [asyncio.create_task(s.run()) for s in self.subscriptions]
+        if settings.execution_ws_endpoint:
+            new_heads_subscription = NewHeadsSubscription(
+                settings.execution_ws_endpoint, self.on_new_head
+            )
+            subscription_tasks.append(asyncio.create_task(new_heads_subscription.run()))
+        try:
+            while True:
+                start_time = time.time()
+                try:
+                    await self.poll()
+                except Exception as exc:
+                    logger.exception(exc)
+
+                poll_time = time.time() - start_time
+                await self._wait_new_head(
+                    max(float(settings.network_config.SECONDS_PER_BLOCK) - poll_time, 0)
+                )
+        finally:
+            for task in subscription_tasks:
+                task.cancel()
+
+    async def _wait_new_head(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._new_head.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._new_head.clear()
+
+    async def poll(self) -> None:
+        finalized, execution_block = await asyncio.gather(
+            get_chain_finalized_head(), execution_client.eth.get_block('latest')
+        )
+        # execution and consensus nodes are working independently of each other
+        if execution_block['number'] < finalized.block_number:
+            logger.warning(
+                'The execution client is behind the consensus client: '
+                'execution block %d, consensus finalized block %d',
+                execution_block['number'],
+                finalized.block_number,
+            )
+            return
+
+        if self.chain_heads is not None and (
+            self.chain_heads.execution_block['hash'] == execution_block['hash']
+            and self.chain_heads.finalized.block_number == finalized.block_number
+        ):
+            for subscription in self.subscriptions:
+                subscription.task.process_unchanged_heads(self.chain_heads)
+            return
+
+        self.chain_heads = ChainHeads(
+            finalized=finalized, execution_block=execution_block, fetched_at=time.time()
+        )
+        for subscription in self.subscriptions:
+            subscription.notify(self.chain_heads)
@@ -0,0 +1,132 @@
+from typing import cast
+
+import pytest
+from eth_typing import BlockNumber
+from web3.types import EventData
+
+from src.common.event_windows import find_last_event
+
+
+class FakeEventSource:
+    """
+    Serves events from the given blocks. Windows wider than `max_blocks_range`
+    that overlap blocks from `limited_from_block` fail like providers' range limit errors.
+    """
+
+    def __init__(
+        self,
+        event_blocks: list[int],
+        max_blocks_range: int | None = None,
+        limited_from_block: int = 0,
+        limited_to_block: int = 2**32,
+    ) -> None:
+        self.event_blocks = sorted(event_blocks)
+        self.max_blocks_range = max_blocks_range
+        self.limited_from_block = limited_from_block
+        self.limited_to_block = limited_to_block
+        self.calls: list[tuple[int, int]] = []
+
+    async def get_logs(self, from_block: BlockNumber, to_block: BlockNumber) -> list[EventData]:
+        self.calls.append((from_block, to_block))
+        if (
+            self.max_blocks_range is not None
+            and to_block - from_block > self.max_blocks_range
+            and from_block <= self.limited_to_block
+            and to_block >= self.limited_from_block
+        ):
+            raise ValueError('query returned more than 10000 results')
+        return [
+            cast(EventData, {'blockNumber': block})
+            for block in self.event_blocks
+            if from_block <= block <= to_block
+        ]
+
+
+async def find_last_block(
+    source: FakeEventSource, blocks_range: int = 9, concurrency: int = 4
+) -> int | None:
+    event = await find_last_event(
+        source.get_logs,
+        from_block=BlockNumber(0),
+        to_block=BlockNumber(99),
+        blocks_range=blocks_range,
+        concurrency=concurrency,
+    )
+    return event['blockNumber'] if event else None
+
+
+@pytest.mark.asyncio
+async def test_newest_event_in_batch():
+    source = FakeEventSource([5, 62, 75, 91, 93])
+
+    assert await find_last_block(source) == 93
+    assert source.calls == [(90, 99), (80, 89), (70, 79), (60, 69)]
+
+
+@pytest.mark.asyncio
+async def test_newest_event_in_older_batch():
+    source = FakeEventSource([5, 12])
+
+    assert await find_last_block(source) == 12
+    # the second batch uses doubled windows
+    assert source.calls[4:] == [(41, 59), (22, 40), (3, 21), (0, 2)]
+
+
+@pytest.mark.asyncio
+async def test_no_events():
+    source = FakeEventSource([])
+
+    assert await find_last_block(source) is None
+    assert min(from_block for from_block, _ in source.calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_range_limit_error_in_batch():
+    source = FakeEventSource(
+        [72, 85], max_blocks_range=4, limited_from_block=70, limited_to_block=79
+    )
+
+    # the event from the window after the failed one is not returned
+    assert await find_last_block(source) == 85
+
+    source = FakeEventSource(
+        [65, 72], max_blocks_range=4, limited_from_block=70, limited_to_block=79
+    )
+
+    assert await find_last_block(source) == 72
+    assert source.calls[:4] == [(90, 99), (80, 89), (70, 79), (60, 69)]
+    # retries from the failed window with halved windows
+    assert source.calls[4:] == [(75, 79), (70, 74), (65, 69), (60, 64)]
+
+
+@pytest.mark.asyncio
+async def test_range_limit_error_shrinks_to_single_block():
+    source = FakeEventSource([97], max_blocks_range=0)
+
+    assert await find_last_block(source) == 97
+    assert source.calls[-4:] == [(99, 99), (98, 98), (97, 97), (96, 96)]
+
+
+@pytest.mark.asyncio
+async def test_range_limit_error_single_block():
+    source = FakeEventSource([97], max_blocks_range=-1)
+
+    with pytest.raises(ValueError, match='query returned more than'):
+        await find_last_block(source)
+    # fails on the single block windows
+    assert source.calls[-4:] == [(99, 99), (98, 98), (97, 97), (96, 96)]
+
+
+@pytest.mark.asyncio
+async def test_other_error():
+    async def get_logs(from_block: BlockNumber, to_block: BlockNumber) -> list[EventData]:
+        raise ValueError('execution reverted')
+
+    with pytest.raises(ValueError, match='execution reverted'):
+        await find_last_event(
+            get_logs,
+            from_block=BlockNumber(0),
+            to_block=BlockNumber(99),
+            blocks_range=9,
+            concurrency=4,
+        )
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+from websockets.asyncio.server import ServerConnection, serve
+
+from src.common.new_heads import NewHeadsSubscription
+
+
+class StandInNode:
+    """JSON-RPC WebSocket server that sends a few `newHeads` notifications per connection."""
+
+    def __init__(self, heads_per_connection: int) -> None:
+        self.heads_per_connection = heads_per_connection
+        self.connections = 0
+        self.block_number = 100
+
+    async def handler(self, websocket: ServerConnection) -> None:
+        self.connections += 1
+        async for message in websocket:
+            request = json.loads(message)
+            if request['method'] != 'eth_subscribe':
+                await websocket.send(
+                    json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': None})
+                )
+                continue
+
+            subscription_id = f'0x{self.connections:x}'
+            await websocket.send(
+                json.dumps({'jsonrpc': '2.0', 'id': request['id'], 'result': subscription_id})
+            )
+            for _ in range(self.heads_per_connection):
+                self.block_number += 1
+                await websocket.send(
+                    json.dumps(
+                        {
+                            'jsonrpc': '2.0',
+                            'method': 'eth_subscription',
+                            'params': {
+                                'subscription': subscription_id,
+                                'result': {
+                                    'number': hex(self.block_number),
+                                    'hash': '0x' + f'{self.block_number:064x}',
+                                    'parentHash': '0x' + f'{self.block_number - 1:064x}',
+                                },
+                            },
+                        }
+                    )
+                )
+            # emulate node restart
+            await websocket.close()
+            return
+
+
+async def receive_heads(node: StandInNode, count: int) -> list[int]:
+    heads: list[int] = []
+    received = asyncio.Event()
+
+    def on_new_head(block_number: int) -> None:
+        heads.append(block_number)
+        if len(heads) >= count:
+            received.set()
+
+    async with serve(node.handler, '127.0.0.1', 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        subscription = NewHeadsSubscription(
+            f'ws://127.0.0.1:{port}', on_new_head, reconnect_delay=0.01
+        )
+        task = asyncio.create_task(subscription.run())
+        try:
+            await asyncio.wait_for(received.wait(), timeout=10)
+        finally:
+            task.cancel()
+    return heads
+
+
+@pytest.mark.asyncio
+async def test_new_heads():
+    heads = await receive_heads(StandInNode(heads_per_connection=3), count=3)
+
+    assert heads == [101, 102, 103]
+
+
+@pytest.mark.asyncio
+async def test_new_heads_reconnect():
+    node = StandInNode(heads_per_connection=2)
+    heads = await receive_heads(node, count=6)
+
+    assert heads[:6] == [101, 102, 103, 104, 105, 106]
+    assert node.connections >= 3
+
+
+@pytest.mark.asyncio
+async def test_new_heads_server_unavailable():
+    heads: list[int] = []
+    subscription = NewHeadsSubscription(
+        'ws://127.0.0.1:1', heads.append, reconnect_delay=0.01, max_reconnect_delay=0.02
+    )
+    task = asyncio.create_task(subscription.run())
+    await asyncio.sleep(0.2)
+
+    # keeps reconnecting
+    assert not task.done()
+    assert not subscription.is_subscribed
+    task.cancel()
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 from eth_typing import BlockNumber
+from sw_utils.typings import ChainHead
+from web3.types import BlockData
 
 
 class Singleton(type):
@@ -12,7 +14,20 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+@dataclass
+class ChainHeads:
+    finalized: ChainHead
+    # latest execution block, may be reorged
+    execution_block: BlockData
+    fetched_at: float
+
+    @property
+    def execution_block_number(self) -> BlockNumber:
+        return self.execution_block['number']
+
+
 @dataclass
 class OraclesCache:
     checkpoint_block: BlockNumber
     config: dict
+    ipfs_hash: str | None = None
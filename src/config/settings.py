@@ -1,3 +1,5 @@
+import os
+
 from decouple import Csv, config
 
 from src.config.networks import NETWORKS, NetworkConfig
@@ -13,6 +15,10 @@ network_config: NetworkConfig = NETWORKS[network]
 execution_endpoint: str = config('EXECUTION_ENDPOINT')
 execution_timeout: int = config('EXECUTION_TIMEOUT', cast=int, default=60)
 execution_retry_timeout: int = config('EXECUTION_RETRY_TIMEOUT', cast=int, default=60)
+# optional WebSocket endpoint, background tasks are woken up by `newHeads` subscription
+execution_ws_endpoint: str = config('EXECUTION_WS_ENDPOINT', default='')
+# number of `eth_getLogs` windows fetched concurrently when searching for the last event
+events_scan_concurrency: int = config('EVENTS_SCAN_CONCURRENCY', cast=int, default=4)
 
 consensus_endpoint: str = config('CONSENSUS_ENDPOINT')
 consensus_timeout: int = config('CONSENSUS_TIMEOUT', cast=int, default=60)
@@ -37,8 +43,54 @@ genesis_validators_ipfs_timeout: int = config(
 genesis_validators_ipfs_retry_timeout: int = config(
     'GENESIS_VALIDATORS_IPFS_RETRY_TIMEOUT', default=600, cast=int
 )
+# snapshot created with `src/cli.py export-validators`, loaded on start if database is empty
+validators_snapshot_file: str = config('VALIDATORS_SNAPSHOT_FILE', default='')
+# genesis validators are saved in transactions of this size
+genesis_validators_batch_size: int = config(
+    'GENESIS_VALIDATORS_BATCH_SIZE', default=50000, cast=int
+)
 
 database: str = config('DATABASE')
+# fetched IPFS files, empty value disables the cache
+ipfs_cache_dir: str = config(
+    'IPFS_CACHE_DIR', default=os.path.join(os.path.dirname(database), 'ipfs-cache')
+)
+# sqlite pragmas, see https://www.sqlite.org/pragma.html
+database_synchronous: str = config('DATABASE_SYNCHRONOUS', default='NORMAL')
+# negative value is the cache size in KiB
+database_cache_size: int = config('DATABASE_CACHE_SIZE', cast=int, default=-64000)
+database_mmap_size: int = config('DATABASE_MMAP_SIZE', cast=int, default=256 * 1024 * 1024)
+database_cached_statements: int = config('DATABASE_CACHED_STATEMENTS', cast=int, default=128)
+# threads for read queries from async code, writes always run in a single thread
+database_read_threads: int = config('DATABASE_READ_THREADS', cast=int, default=4)
+
+# Network validators deposited after the last saved one are kept in memory
+# and updated every block. If the update is older than VALIDATORS_TAIL_MAX_AGE seconds
+# `wait` mode waits for the next update and fetches deposits from the execution node
+# if there's none, `fallback` mode fetches them right away.
+VALIDATORS_TAIL_MODE_WAIT = 'wait'
+VALIDATORS_TAIL_MODE_FALLBACK = 'fallback'
+
+validators_tail_max_age: int = config(
+    'VALIDATORS_TAIL_MAX_AGE', cast=int, default=2 * network_config.SECONDS_PER_BLOCK
+)
+validators_tail_stale_mode: str = config(
+    'VALIDATORS_TAIL_STALE_MODE', default=VALIDATORS_TAIL_MODE_FALLBACK
+)
+
+# BLS backend for exit signature shares: auto, py_ecc, arkworks
+bls_backend: str = config('BLS_BACKEND', default='auto')
+
+# Number of worker processes for CPU-bound crypto. 0 runs crypto in the event loop.
+process_pool_size: int = config('PROCESS_POOL_SIZE', cast=int, default=0)
+
+# Max number of cached exit message signing roots and their G2 hashes
+exit_message_cache_size: int = config('EXIT_MESSAGE_CACHE_SIZE', cast=int, default=10000)
+
+# Number of deposit signatures verified by one process pool job
+deposit_verification_chunk_size: int = config(
+    'DEPOSIT_VERIFICATION_CHUNK_SIZE', cast=int, default=100
+)
 
 # logging
 LOG_PLAIN = 'plain'
@@ -52,3 +104,11 @@ sentry_dsn: str = config('SENTRY_DSN', default='')
 sentry_environment = config('SENTRY_ENVIRONMENT', default='')
 
 VALIDATOR_LIFETIME: int = config('VALIDATOR_LIFETIME', default=3600, cast=int)
+
+# in-flight validators are restored from the journal on restart, disabled by default.
+# The journal holds exit signatures and their shares in plaintext, keep it private.
+validators_journal_file: str = config('VALIDATORS_JOURNAL_FILE', default='')
+# journal is rewritten with the current validators after this number of records
+validators_journal_compaction_records: int = config(
+    'VALIDATORS_JOURNAL_COMPACTION_RECORDS', default=10000, cast=int
+)
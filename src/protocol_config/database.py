@@ -0,0 +1,47 @@
+import json
+
+from src.common.clients import db_client
+from src.common.typings import OraclesCache
+from src.config import settings
+
+
+class OraclesCacheCrud:
+    @property
+    def ORACLES_CACHE_TABLE(self) -> str:
+        return f'{settings.network}_oracles_cache'
+
+    def get_oracles_cache(self) -> OraclesCache | None:
+        with db_client.get_db_connection() as conn:
+            res = conn.execute(
+                f'SELECT checkpoint_block, ipfs_hash, config FROM {self.ORACLES_CACHE_TABLE}'
+            ).fetchone()
+            if res is None:
+                return None
+            return OraclesCache(
+                checkpoint_block=res[0], ipfs_hash=res[1], config=json.loads(res[2])
+            )
+
+    def save_oracles_cache(self, oracles_cache: OraclesCache) -> None:
+        with db_client.get_db_connection() as conn:
+            conn.execute(f'DELETE FROM {self.ORACLES_CACHE_TABLE}')
+            conn.execute(
+                f'INSERT INTO {self.ORACLES_CACHE_TABLE} VALUES(?, ?, ?)',
+                (
+                    oracles_cache.checkpoint_block,
+                    oracles_cache.ipfs_hash,
+                    json.dumps(oracles_cache.config),
+                ),
+            )
+
+    def setup(self) -> None:
+        """Creates tables."""
+        with db_client.get_db_connection() as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.ORACLES_CACHE_TABLE} (
+                    checkpoint_block INTEGER NOT NULL,
+                    ipfs_hash VARCHAR(64),
+                    config TEXT NOT NULL
+                )
+                """
+            )
@@ -5,29 +5,34 @@ from eth_typing import BlockNumber
 from sw_utils import build_protocol_config
 
 from src.app_state import AppState
-from src.common.checks import wait_execution_catch_up_consensus
-from src.common.clients import execution_client, ipfs_fetch_client
-from src.common.consensus import get_chain_finalized_head
+from src.common.clients import db_client, execution_client
 from src.common.contracts import keeper_contract
+from src.common.ipfs import fetch_json
 from src.common.tasks import BaseTask
-from src.common.typings import OraclesCache
+from src.common.typings import ChainHeads, OraclesCache
 from src.config import settings
+from src.protocol_config.database import OraclesCacheCrud
 
 logger = logging.getLogger(__name__)
 
 
 class ProtocolConfigTask(BaseTask):
-    async def process_block(self) -> None:
-        chain_state = await get_chain_finalized_head()
-        await wait_execution_catch_up_consensus(chain_state=chain_state)
-        await update_protocol_config()
+    async def process_block(self, chain_heads: ChainHeads) -> None:
+        await update_protocol_config(chain_heads.execution_block_number)
 
 
-async def update_protocol_config() -> None:
+async def update_protocol_config(to_block: BlockNumber | None = None) -> None:
     """
     Fetches latest oracle config from IPFS. Uses cache if possible.
+    The cache is saved to the database, so restart scans only the blocks after checkpoint.
     """
     app_state = AppState()
+    if app_state.oracles_cache is None:
+        app_state.oracles_cache = await db_client.read(OraclesCacheCrud().get_oracles_cache)
+        if app_state.oracles_cache:
+            app_state.protocol_config = build_protocol_config(
+                config_data=app_state.oracles_cache.config
+            )
     oracles_cache = app_state.oracles_cache
 
     # Find the latest block for which oracle config is cached
@@ -36,7 +41,8 @@ async def update_protocol_config() -> None:
     else:
         from_block = settings.network_config.KEEPER_GENESIS_BLOCK
 
-    to_block = await execution_client.eth.get_block_number()
+    if to_block is None:
+        to_block = await execution_client.eth.get_block_number()
 
     if from_block > to_block:
         return
@@ -45,13 +51,16 @@ async def update_protocol_config() -> None:
     event = await keeper_contract.get_config_updated_event(from_block=from_block, to_block=to_block)
     if event:
         ipfs_hash = event['args']['configIpfsHash']
-        config = cast(dict, await ipfs_fetch_client.fetch_json(ipfs_hash))
+        config = cast(dict, await fetch_json(ipfs_hash))
     else:
+        ipfs_hash = oracles_cache.ipfs_hash  # type: ignore
         config = oracles_cache.config  # type: ignore
 
     app_state.oracles_cache = OraclesCache(
         config=config,
         checkpoint_block=to_block,
+        ipfs_hash=ipfs_hash,
     )
+    await db_client.write(OraclesCacheCrud().save_oracles_cache, app_state.oracles_cache)
 
     app_state.protocol_config = build_protocol_config(config_data=app_state.oracles_cache.config)
@@ -0,0 +1,232 @@
+import functools
+import secrets
+from typing import Any
+
+import milagro_bls_binding as bls
+from eth_typing import BLSPubkey, BLSSignature
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primitives import (
+    G1_to_pubkey,
+    G2_to_signature,
+    pubkey_to_G1,
+    signature_to_G2,
+)
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.optimized_bls12_381.optimized_curve import G1, add, curve_order, multiply
+
+try:
+    import py_arkworks_bls12381 as arkworks
+
+    ARKWORKS_INSTALLED = True
+except ImportError:  # pragma: no cover
+    ARKWORKS_INSTALLED = False
+
+BLS_BACKEND_AUTO = 'auto'
+BLS_BACKEND_PY_ECC = 'py_ecc'
+BLS_BACKEND_ARKWORKS = 'arkworks'
+
+
+class BLSBackend:
+    """
+    G1/G2 arithmetic used for splitting and reconstructing BLS signatures.
+    Points are backend specific, bytes are the same for all backends.
+    """
+
+    name: str = ''
+
+    # whether `batch_verify` is cheaper than verifying signatures one by one
+    batch_verify_supported: bool = False
+
+    def hash_to_G2(self, message: bytes) -> Any:
+        raise NotImplementedError
+
+    def signature_to_G2(self, signature: BLSSignature) -> Any:
+        raise NotImplementedError
+
+    def G2_to_signature(self, point: Any) -> BLSSignature:
+        raise NotImplementedError
+
+    def pubkey_to_G1(self, public_key: BLSPubkey) -> Any:
+        raise NotImplementedError
+
+    def G1_to_pubkey(self, point: Any) -> BLSPubkey:
+        raise NotImplementedError
+
+    def G1_generator(self) -> Any:
+        raise NotImplementedError
+
+    def add(self, p1: Any, p2: Any) -> Any:
+        raise NotImplementedError
+
+    def multiply(self, point: Any, n: int) -> Any:
+        raise NotImplementedError
+
+    def multiexp(self, points: list, scalars: list[int]) -> Any:
+        """Calculates sum of `points[i] * scalars[i]`, points must be non-empty."""
+        result = self.multiply(points[0], scalars[0])
+        for point, scalar in zip(points[1:], scalars[1:]):
+            result = self.add(result, self.multiply(point, scalar))
+        return result
+
+    def batch_verify(
+        self,
+        public_keys: list[BLSPubkey],
+        messages: list[bytes],
+        signatures: list[BLSSignature],
+        messages_g2: list[bytes] | None = None,
+    ) -> bool:
+        """
+        Checks that all signatures are valid. Doesn't tell which signature is invalid.
+        `messages_g2` are compressed `hash_to_G2(message)` if they are already known.
+        """
+        del messages_g2  # milagro hashes messages itself
+        return all(
+            bls.Verify(public_key, message, signature)
+            for public_key, message, signature in zip(public_keys, messages, signatures)
+        )
+
+
+class PyEccBLSBackend(BLSBackend):
+    """Pure-python backend, always available."""
+
+    name = BLS_BACKEND_PY_ECC
+
+    def hash_to_G2(self, message: bytes) -> Any:
+        return hash_to_G2(
+            message, G2ProofOfPossession.DST, G2ProofOfPossession.xmd_hash_function  # type: ignore
+        )
+
+    def signature_to_G2(self, signature: BLSSignature) -> Any:
+        return signature_to_G2(signature)
+
+    def G2_to_signature(self, point: Any) -> BLSSignature:
+        return BLSSignature(G2_to_signature(point))
+
+    def pubkey_to_G1(self, public_key: BLSPubkey) -> Any:
+        return pubkey_to_G1(public_key)
+
+    def G1_to_pubkey(self, point: Any) -> BLSPubkey:
+        return BLSPubkey(G1_to_pubkey(point))
+
+    def G1_generator(self) -> Any:
+        return G1
+
+    def add(self, p1: Any, p2: Any) -> Any:
+        return add(p1, p2)
+
+    def multiply(self, point: Any, n: int) -> Any:
+        return multiply(point, n)
+
+
+class ArkworksBLSBackend(BLSBackend):
+    """Compiled backend, requires `py-arkworks-bls12381` package."""
+
+    name = BLS_BACKEND_ARKWORKS
+    batch_verify_supported = True
+
+    def hash_to_G2(self, message: bytes) -> Any:
+        return arkworks.G2Point.hash_to_curve(message, G2ProofOfPossession.DST)
+
+    def signature_to_G2(self, signature: BLSSignature) -> Any:
+        return arkworks.G2Point.from_compressed_bytes(bytes(signature))
+
+    def G2_to_signature(self, point: Any) -> BLSSignature:
+        return BLSSignature(bytes(point.to_compressed_bytes()))
+
+    def pubkey_to_G1(self, public_key: BLSPubkey) -> Any:
+        return arkworks.G1Point.from_compressed_bytes(bytes(public_key))
+
+    def G1_to_pubkey(self, point: Any) -> BLSPubkey:
+        return BLSPubkey(bytes(point.to_compressed_bytes()))
+
+    def G1_generator(self) -> Any:
+        return arkworks.G1Point()
+
+    def add(self, p1: Any, p2: Any) -> Any:
+        return p1 + p2
+
+    def multiply(self, point: Any, n: int) -> Any:
+        return point * arkworks.Scalar(n % curve_order)
+
+    def multiexp(self, points: list, scalars: list[int]) -> Any:
+        return type(points[0]).multiexp_unchecked(
+            points, [arkworks.Scalar(s % curve_order) for s in scalars]
+        )
+
+    def batch_verify(
+        self,
+        public_keys: list[BLSPubkey],
+        messages: list[bytes],
+        signatures: list[BLSSignature],
+        messages_g2: list[bytes] | None = None,
+    ) -> bool:
+        """
+        Random linear combination check:
+        e(sum(r_i * sig_i), -G1) * prod(e(H(m_i), r_i * pk_i)) == 1
+        Random `r_i` prevent invalid signatures from cancelling each other out.
+        Costs n + 1 pairings instead of 2n for separate checks.
+        """
+        try:
+            public_key_points = [self.pubkey_to_G1(p) for p in public_keys]
+            signature_points = [self.signature_to_G2(s) for s in signatures]
+            if messages_g2 is None:
+                message_points = [self.hash_to_G2(m) for m in messages]
+            else:
+                message_points = [self.signature_to_G2(BLSSignature(m)) for m in messages_g2]
+        except Exception:
+            return False
+
+        identity = arkworks.G1Point.identity()
+        if any(p == identity for p in public_key_points):
+            return False
+
+        scalars = [secrets.randbelow(2**64 - 1) + 1 for _ in signatures]
+        aggregated_signature = self.multiexp(signature_points, scalars)
+        g1_points = [-self.G1_generator()] + [
+            self.multiply(p, r) for p, r in zip(public_key_points, scalars)
+        ]
+        g2_points = [aggregated_signature] + message_points
+
+        return arkworks.GT.pairing_check(g1_points, g2_points)
+
+
+def verify_signatures(
+    public_keys: list[BLSPubkey],
+    messages: list[bytes],
+    signatures: list[BLSSignature],
+    messages_g2: list[bytes] | None = None,
+    backend: BLSBackend | None = None,
+) -> list[bool]:
+    """
+    Verifies all signatures together if the backend supports batch verification.
+    Falls back to separate checks to find invalid signatures if the batch fails.
+    """
+    backend = backend or get_bls_backend()
+    if len(signatures) > 1 and backend.batch_verify_supported:
+        if backend.batch_verify(public_keys, messages, signatures, messages_g2):
+            return [True] * len(signatures)
+
+    return [
+        bls.Verify(public_key, message, signature)
+        for public_key, message, signature in zip(public_keys, messages, signatures)
+    ]
+
+
+@functools.cache
+def get_bls_backend(name: str = BLS_BACKEND_AUTO) -> BLSBackend:
+    """
+    Returns BLS backend by name.
+    `auto` picks the compiled backend when it is installed and falls back to py_ecc.
+    """
+    if name == BLS_BACKEND_AUTO:
+        name = BLS_BACKEND_ARKWORKS if ARKWORKS_INSTALLED else BLS_BACKEND_PY_ECC
+
+    if name == BLS_BACKEND_PY_ECC:
+        return PyEccBLSBackend()
+
+    if name == BLS_BACKEND_ARKWORKS:
+        if not ARKWORKS_INSTALLED:
+            raise RuntimeError('py-arkworks-bls12381 package is not installed')
+        return ArkworksBLSBackend()
+
+    raise ValueError(f'unknown BLS backend: {name}')
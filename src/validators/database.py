@@ -1,27 +1,110 @@
 import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Sequence
 
 from eth_typing import HexStr
 
 from src.common.clients import db_client
 from src.config import settings
-from src.validators.typings import NetworkValidator
+from src.validators.typings import NetworkValidator, NetworkValidatorRow
 
 logger = logging.getLogger(__name__)
 
 
+def public_key_to_bytes(public_key: HexStr) -> bytes:
+    return bytes.fromhex(public_key.removeprefix('0x'))
+
+
+def bytes_to_public_key(data: bytes) -> HexStr:
+    return HexStr('0x' + data.hex())
+
+
+def column_to_public_key(value: bytes | str) -> HexStr:
+    """Public keys are hex strings in databases not migrated to raw bytes yet."""
+    if isinstance(value, str):
+        return HexStr(value)
+    return bytes_to_public_key(value)
+
+
+@dataclass
+class Migration:
+    """
+    Schema migration, applied once per network.
+    Migrations must be idempotent: interrupted migration is applied again on restart.
+    """
+
+    version: int
+    apply: Callable[[], None]
+    # deferred migrations run in the background after startup, e.g. new indexes
+    is_deferred: bool = False
+
+
 class NetworkValidatorCrud:
+    # network validators count, loaded from the database in `setup`
+    _validators_count: int | None = None
+    _validators_count_lock = threading.Lock()
+    # public keys are hex strings until the deferred migration 1, checked in `setup`
+    _is_public_key_blob = True
+
     @property
     def NETWORK_VALIDATORS_TABLE(self) -> str:
         return f'{settings.network}_network_validators'
 
+    @property
+    def NETWORK_VALIDATORS_STATS_TABLE(self) -> str:
+        return f'{settings.network}_network_validators_stats'
+
+    @property
+    def GENESIS_VALIDATORS_TABLE(self) -> str:
+        return f'{settings.network}_genesis_validators'
+
+    @property
+    def SCHEMA_MIGRATIONS_TABLE(self) -> str:
+        return f'{settings.network}_schema_migrations'
+
     def save_network_validators(self, validators: list[NetworkValidator]) -> None:
-        """Saves network validators."""
-        with db_client.get_db_connection() as conn:
-            conn.executemany(
-                f'INSERT INTO {self.NETWORK_VALIDATORS_TABLE} '
-                ' VALUES(:public_key, :block_number) ON CONFLICT DO NOTHING',
-                [(val.public_key, val.block_number) for val in validators],
+        """Saves network validators and updates validators count in the same transaction."""
+        self.save_network_validator_rows(
+            [(public_key_to_bytes(val.public_key), val.block_number) for val in validators]
+        )
+
+    def save_network_validator_rows(self, rows: list[NetworkValidatorRow]) -> None:
+        """Same as `save_network_validators` for `(public_key, block_number)` raw rows."""
+        self.save_network_validator_batches([rows])
+
+    def save_network_validator_batches(self, batches: Iterable[list[NetworkValidatorRow]]) -> None:
+        """
+        Saves batches of `(public_key, block_number)` raw rows in a single transaction.
+        Batches may be generated lazily, exception in the generator rolls back all batches.
+        """
+        conn = db_client.get_db_connection()
+        try:
+            total_changes = conn.total_changes
+            for rows in batches:
+                params: Sequence[tuple] = rows
+                if not NetworkValidatorCrud._is_public_key_blob:
+                    params = [(bytes_to_public_key(key), number) for key, number in rows]
+                conn.executemany(
+                    f'INSERT INTO {self.NETWORK_VALIDATORS_TABLE} '
+                    ' VALUES(:public_key, :block_number) ON CONFLICT DO NOTHING',
+                    params,
+                )
+            inserted_count = conn.total_changes - total_changes
+            conn.execute(
+                f'UPDATE {self.NETWORK_VALIDATORS_STATS_TABLE} '
+                'SET validators_count = validators_count + ?',
+                (inserted_count,),
             )
+            # readers must see the new rows and the new count together
+            with NetworkValidatorCrud._validators_count_lock:
+                conn.commit()
+                if NetworkValidatorCrud._validators_count is not None:
+                    NetworkValidatorCrud._validators_count += inserted_count
+        except Exception:
+            conn.rollback()
+            raise
 
     def get_last_network_validator(self) -> NetworkValidator | None:
         """Fetches last network validator."""
@@ -32,24 +115,75 @@ class NetworkValidatorCrud:
                     FROM {network_validators_table} ORDER BY block_number DESC LIMIT 1'''
             ).fetchone()
             if res:
-                return NetworkValidator(public_key=res[0], block_number=res[1])
+                return NetworkValidator(
+                    public_key=column_to_public_key(res[0]), block_number=res[1]
+                )
             return None
 
-    def get_next_validator_index(self, latest_public_keys: list[HexStr]) -> int:
-        """Retrieves the index for the next validator."""
+    def get_network_validator_rows(self) -> Iterator[NetworkValidatorRow]:
+        """Yields `(public_key, block_number)` raw rows in the saving order."""
+        conn = db_client.get_db_connection()
+        for public_key, block_number in conn.execute(
+            f'SELECT public_key, block_number FROM {self.NETWORK_VALIDATORS_TABLE} ORDER BY rowid'
+        ):
+            if isinstance(public_key, str):
+                public_key = public_key_to_bytes(HexStr(public_key))
+            yield public_key, block_number
+
+    def get_genesis_validators_loaded(self) -> bool | None:
+        """Returns None if genesis validators load has never started."""
         with db_client.get_db_connection() as conn:
-            if latest_public_keys:
-                cur = conn.execute(
-                    f'''SELECT COUNT(*) FROM {self.NETWORK_VALIDATORS_TABLE}
-                        WHERE public_key NOT IN ({','.join(['?'] * len(latest_public_keys))})''',
-                    latest_public_keys,
-                )
-            else:
-                cur = conn.execute(f'SELECT COUNT(*) FROM {self.NETWORK_VALIDATORS_TABLE}')
+            res = conn.execute(f'SELECT is_loaded FROM {self.GENESIS_VALIDATORS_TABLE}').fetchone()
+            if res is None:
+                return None
+            return bool(res[0])
+
+    def set_genesis_validators_loaded(self, ipfs_hash: str, is_loaded: bool) -> None:
+        with db_client.get_db_connection() as conn:
+            conn.execute(f'DELETE FROM {self.GENESIS_VALIDATORS_TABLE}')
+            conn.execute(
+                f'INSERT INTO {self.GENESIS_VALIDATORS_TABLE} VALUES(?, ?)',
+                (ipfs_hash, is_loaded),
+            )
+
+    def get_validators_count(self) -> int:
+        if NetworkValidatorCrud._validators_count is None:
+            with db_client.get_db_connection() as conn:
+                NetworkValidatorCrud._validators_count = conn.execute(
+                    f'SELECT validators_count FROM {self.NETWORK_VALIDATORS_STATS_TABLE}'
+                ).fetchone()[0]
+
+        return NetworkValidatorCrud._validators_count
+
+    @staticmethod
+    def get_cached_validators_count() -> int | None:
+        """Returns validators count without a database query, `None` if it's not loaded."""
+        return NetworkValidatorCrud._validators_count
+
+    def get_next_validator_index(self, latest_public_keys: list[HexStr]) -> int:
+        """
+        Retrieves the index for the next validator.
+        Latest public keys already saved to the database are counted once.
+        """
+        with NetworkValidatorCrud._validators_count_lock:
+            index = self.get_validators_count()
+            if not latest_public_keys:
+                return index
 
-            index = cur.fetchone()[0]
+            conn = db_client.get_db_connection()
+            for public_key in latest_public_keys:
+                param: bytes | str = public_key
+                if NetworkValidatorCrud._is_public_key_blob:
+                    param = public_key_to_bytes(public_key)
+                is_saved = conn.execute(
+                    f'SELECT EXISTS(SELECT 1 FROM {self.NETWORK_VALIDATORS_TABLE} '
+                    'WHERE public_key = ?)',
+                    (param,),
+                ).fetchone()[0]
+                if not is_saved:
+                    index += 1
 
-        return index + len(latest_public_keys)
+        return index
 
     def setup(self) -> None:
         """Creates tables."""
@@ -57,8 +191,165 @@ class NetworkValidatorCrud:
             conn.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS {self.NETWORK_VALIDATORS_TABLE} (
-                    public_key VARCHAR(98) UNIQUE NOT NULL,
+                    public_key BLOB UNIQUE NOT NULL,
                     block_number INTEGER NOT NULL
                 )
                 """
             )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.NETWORK_VALIDATORS_STATS_TABLE} (
+                    validators_count INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.GENESIS_VALIDATORS_TABLE} (
+                    ipfs_hash VARCHAR(64) NOT NULL,
+                    is_loaded INTEGER NOT NULL
+                )
+                """
+            )
+            # count validators saved before the stats table was added
+            conn.execute(
+                f"""
+                INSERT INTO {self.NETWORK_VALIDATORS_STATS_TABLE}
+                SELECT (SELECT COUNT(*) FROM {self.NETWORK_VALIDATORS_TABLE})
+                WHERE NOT EXISTS (SELECT 1 FROM {self.NETWORK_VALIDATORS_STATS_TABLE})
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.SCHEMA_MIGRATIONS_TABLE} (
+                    version INTEGER PRIMARY KEY
+                )
+                """
+            )
+
+        NetworkValidatorCrud._is_public_key_blob = self._is_public_key_column_blob()
+        self.apply_migrations(is_deferred=False)
+
+        NetworkValidatorCrud._validators_count = None
+        logger.info('Network validators count: %d', self.get_validators_count())
+
+    def get_migrations(self) -> list[Migration]:
+        return [
+            Migration(version=1, apply=self._migrate_public_keys_to_blob, is_deferred=True),
+            Migration(version=2, apply=self._create_block_number_index, is_deferred=True),
+        ]
+
+    def apply_migrations(self, is_deferred: bool) -> None:
+        """Applies either startup or deferred migrations missing in the database."""
+        conn = db_client.get_db_connection()
+        applied_versions = {
+            row[0] for row in conn.execute(f'SELECT version FROM {self.SCHEMA_MIGRATIONS_TABLE}')
+        }
+        for migration in self.get_migrations():
+            if migration.version in applied_versions or migration.is_deferred != is_deferred:
+                continue
+
+            logger.info('Applying database migration %d...', migration.version)
+            start_time = time.time()
+            migration.apply()
+            with conn:
+                conn.execute(
+                    f'INSERT INTO {self.SCHEMA_MIGRATIONS_TABLE} VALUES(?)', (migration.version,)
+                )
+            logger.info(
+                'Applied database migration %d in %.1f s',
+                migration.version,
+                time.time() - start_time,
+            )
+
+    def _create_block_number_index(self) -> None:
+        """Used to find the last network validator."""
+        with db_client.get_db_connection() as conn:
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS {self.NETWORK_VALIDATORS_TABLE}_block_number '
+                f'ON {self.NETWORK_VALIDATORS_TABLE}(block_number)'
+            )
+
+    def _is_public_key_column_blob(self) -> bool:
+        conn = db_client.get_db_connection()
+        columns = conn.execute(f'PRAGMA table_info({self.NETWORK_VALIDATORS_TABLE})').fetchall()
+        # (cid, name, type, notnull, dflt_value, pk)
+        return any(column[1] == 'public_key' and column[2] == 'BLOB' for column in columns)
+
+    def _migrate_public_keys_to_blob(self) -> None:
+        """
+        Public keys were saved as hex strings, raw bytes take less than half of the space.
+        Runs in the writer thread after startup: the table is rebuilt in a single transaction,
+        saving order is preserved. Queries use hex strings until the transaction is committed,
+        readers see the old table till then.
+        Pages of the dropped table are reused by the new rows, the file doesn't shrink.
+        """
+        if self._is_public_key_column_blob():
+            NetworkValidatorCrud._is_public_key_blob = True
+            return
+
+        logger.info('Migrating network validators public keys to binary format...')
+        table = self.NETWORK_VALIDATORS_TABLE
+        conn = db_client.get_db_connection()
+        conn.create_function('public_key_to_bytes', 1, public_key_to_bytes, deterministic=True)
+        try:
+            conn.execute('BEGIN')
+            conn.execute(
+                f"""
+                CREATE TABLE {table}_blob (
+                    public_key BLOB UNIQUE NOT NULL,
+                    block_number INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"""
+                INSERT INTO {table}_blob
+                SELECT public_key_to_bytes(public_key), block_number FROM {table} ORDER BY rowid
+                """
+            )
+            conn.execute(f'DROP TABLE {table}')
+            conn.execute(f'ALTER TABLE {table}_blob RENAME TO {table}')
+            # queries switch to raw bytes together with the commit
+            with NetworkValidatorCrud._validators_count_lock:
+                conn.commit()
+                NetworkValidatorCrud._is_public_key_blob = True
+        except Exception:
+            conn.rollback()
+            raise
+
+        logger.info('Network validators public keys migrated')
+
+
+class AsyncNetworkValidatorCrud:
+    """
+    Runs `NetworkValidatorCrud` queries in the database threads,
+    so async handlers and tasks don't block the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.crud = NetworkValidatorCrud()
+
+    async def save_network_validators(self, validators: list[NetworkValidator]) -> None:
+        await db_client.write(self.crud.save_network_validators, validators)
+
+    async def save_network_validator_rows(self, rows: list[NetworkValidatorRow]) -> None:
+        await db_client.write(self.crud.save_network_validator_rows, rows)
+
+    async def get_last_network_validator(self) -> NetworkValidator | None:
+        return await db_client.read(self.crud.get_last_network_validator)
+
+    async def get_genesis_validators_loaded(self) -> bool | None:
+        return await db_client.read(self.crud.get_genesis_validators_loaded)
+
+    async def set_genesis_validators_loaded(self, ipfs_hash: str, is_loaded: bool) -> None:
+        await db_client.write(self.crud.set_genesis_validators_loaded, ipfs_hash, is_loaded)
+
+    async def get_next_validator_index(self, latest_public_keys: list[HexStr]) -> int:
+        return await db_client.read(self.crud.get_next_validator_index, latest_public_keys)
+
+    async def setup(self) -> None:
+        await db_client.write(self.crud.setup)
+
+    async def apply_deferred_migrations(self) -> None:
+        await db_client.write(self.crud.apply_migrations, True)
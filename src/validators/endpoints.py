@@ -1,39 +1,54 @@
 from time import time
+from typing import Annotated
 
 from eth_typing import BLSSignature, HexStr
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from web3 import Web3
 
 from src.app_state import AppState
 from src.config import settings
 from src.validators.execution import get_validators_start_index
-from src.validators.exit_signature import (
-    get_oracles_exit_signature_shares,
-    validate_exit_signature,
-)
-from src.validators.key_shares import reconstruct_shared_bls_signature
+from src.validators.exit_signature import process_exit_signature_shares
+from src.validators.journal import validators_journal
+from src.validators.response_cache import validators_response_cache
 from src.validators.schema import (
     CreateValidatorsResponse,
-    CreateValidatorsResponseItem,
     ExitSignatureShareRequest,
     ExitSignatureShareResponse,
     ExitsResponse,
-    ExitsResponseItem,
     ValidatorsRequest,
 )
+from src.validators.serialization import (
+    serialize_create_validators_response,
+    serialize_exits_response,
+)
+from src.validators.store import VersionTooOldError
 from src.validators.typings import Validator
 
 router = APIRouter()
 
+MAX_EXITS_PAGE_SIZE = 10000
 
-@router.post('/validators')
+
+@router.post('/validators', response_model=CreateValidatorsResponse)
 async def create_validators(
     request: ValidatorsRequest,
-) -> CreateValidatorsResponse:
+) -> Response:
+    """
+    Operators poll the endpoint until the exit signatures are ready,
+    unchanged responses are served from the cache.
+    """
     app_state = AppState()
-    validator_items = []
+    validators = []
+    new_validators = []
 
     validator_index = await get_validators_start_index()
+    if content := validators_response_cache.get(
+        request.public_keys, validator_index, app_state.validators
+    ):
+        return Response(content=content, media_type='application/json')
+
+    start_index = validator_index
     exit_signatures_ready = True
     now = int(time())
 
@@ -46,29 +61,80 @@ async def create_validators(
                 validator_index=validator_index,
                 created_at=now,
             )
-            app_state.validators[public_key] = validator
+            app_state.validators.add(validator)
+            new_validators.append(validator)
 
         validator_index += 1
 
         if validator.exit_signature is None:
             exit_signatures_ready = False
 
-        validator_items.append(CreateValidatorsResponseItem.from_validator(validator))
-
-    return CreateValidatorsResponse(
-        ready=exit_signatures_ready,
-        validators=validator_items,
+        validators.append(validator)
+
+    validators_journal.add_validators(new_validators)
+
+    content = serialize_create_validators_response(exit_signatures_ready, validators)
+    validators_response_cache.put(request.public_keys, start_index, app_state.validators, content)
+    return Response(content=content, media_type='application/json')
+
+
+@router.get('/exits', response_model=ExitsResponse)
+# pylint: disable-next=too-many-arguments
+async def get_exits(
+    *,
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=MAX_EXITS_PAGE_SIZE)] = None,
+    is_ready: bool | None = None,
+    missing_share_index: Annotated[int | None, Query(ge=0)] = None,
+    created_since: int | None = None,
+    since_version: Annotated[int | None, Query(ge=0)] = None,
+) -> Response:
+    """
+    Returns validators in creation order, all of them unless `limit` is set.
+    With `since_version` returns validators changed after the version in the order of changes
+    and public keys removed after the version, `cursor` is ignored.
+    Changed validators that don't match the filters anymore are listed as removed.
+    """
+    validators = AppState().validators
+
+    def is_match(v: Validator) -> bool:
+        if is_ready is not None and bool(v.exit_signature) != is_ready:
+            return False
+        if missing_share_index is not None and missing_share_index in v.exit_signature_shares:
+            return False
+        if created_since is not None and v.created_at < created_since:
+            return False
+        return True
+
+    if since_version is not None:
+        try:
+            changed, removed, version = validators.get_changes(since_version, limit)
+        except VersionTooOldError as e:
+            raise HTTPException(status.HTTP_410_GONE, str(e)) from e
+
+        content = serialize_exits_response(
+            [v for v in changed if is_match(v)],
+            next_cursor=None,
+            version=version,
+            removed_public_keys=removed + [v.public_key for v in changed if not is_match(v)],
+        )
+        return Response(content=content, media_type='application/json')
+
+    version = validators.version
+    page, next_cursor = validators.get_page(
+        cursor=_parse_exits_cursor(cursor) if cursor else None,
+        limit=limit,
+        created_since=created_since,
+        predicate=is_match,
+        is_ready=is_ready,
     )
-
-
-@router.get('/exits')
-async def get_exits() -> ExitsResponse:
-    app_state = AppState()
-    response = ExitsResponse(exits=[])
-
-    for validator in app_state.validators.values():
-        response.exits.append(ExitsResponseItem.from_validator(validator))
-    return response
+    content = serialize_exits_response(
+        page,
+        next_cursor=f'{next_cursor[0]}-{next_cursor[1]}' if next_cursor else None,
+        version=version,
+        removed_public_keys=[],
+    )
+    return Response(content=content, media_type='application/json')
 
 
 @router.post('/exit-signature')
@@ -76,6 +142,8 @@ async def create_exit_signature_shares(
     request: ExitSignatureShareRequest,
 ) -> ExitSignatureShareResponse:
     app_state = AppState()
+    validators_ready: list[Validator] = []
+    new_shares: list[tuple[HexStr, int, BLSSignature]] = []
 
     for share in request.shares:
         validator = app_state.validators.get(share.public_key)
@@ -86,26 +154,27 @@ async def create_exit_signature_shares(
         if current_share:
             continue
 
-        validator.exit_signature_shares[request.share_index] = BLSSignature(
-            Web3.to_bytes(hexstr=HexStr(share.exit_signature))
-        )
+        exit_signature_share = BLSSignature(Web3.to_bytes(hexstr=HexStr(share.exit_signature)))
+        validator.exit_signature_shares[request.share_index] = exit_signature_share
+        app_state.validators.touch(validator.public_key)
+        new_shares.append((validator.public_key, request.share_index, exit_signature_share))
 
         if len(validator.exit_signature_shares) < settings.signature_threshold:
             continue
 
-        exit_signature = reconstruct_shared_bls_signature(validator.exit_signature_shares)
-        if not validate_exit_signature(
-            validator.public_key, validator.validator_index, exit_signature
-        ):
-            raise RuntimeError('invalid exit signature')
+        validators_ready.append(validator)
 
-        validator.exit_signature = exit_signature
+    validators_journal.add_exit_signature_shares(new_shares)
 
-        oracles_shares = await get_oracles_exit_signature_shares(
-            public_key=validator.public_key,
-            validator_index=validator.validator_index,
-            exit_signature=validator.exit_signature,
-        )
-        validator.oracles_exit_signature_shares = oracles_shares
+    if validators_ready:
+        await process_exit_signature_shares(validators_ready)
 
     return ExitSignatureShareResponse()
+
+
+def _parse_exits_cursor(cursor: str) -> tuple[int, int]:
+    try:
+        created_at, sequence = cursor.split('-')
+        return int(created_at), int(sequence)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, 'invalid cursor') from e
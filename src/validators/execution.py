@@ -1,20 +1,33 @@
+import asyncio
+import itertools
 import logging
 import struct
+import time
 from typing import Set, cast
 
 from eth_typing import BlockNumber, HexStr
 from sw_utils import EventProcessor, is_valid_deposit_data_signature
 from web3 import Web3
 from web3.contract.async_contract import AsyncContractEvent
-from web3.types import EventData
+from web3.exceptions import BlockNotFound
+from web3.types import BlockData, EventData
 
-from src.common.contracts import validators_registry_contract
+from src.app_state import AppState
+from src.common.clients import execution_client
+from src.common.contracts import get_event_logs, validators_registry_contract
+from src.common.process_pool import process_pool
 from src.config import settings
-from src.validators.database import NetworkValidatorCrud
-from src.validators.typings import NetworkValidator
+from src.validators.database import AsyncNetworkValidatorCrud, NetworkValidatorCrud
+from src.validators.typings import NetworkValidator, NetworkValidatorsTail
 
 logger = logging.getLogger(__name__)
 
+# wakes up requests waiting for the network validators tail update
+network_validators_tail_updated = asyncio.Event()
+
+# (validators count, tail from block, tail block hash) -> validators start index
+_validators_start_indexes: dict[tuple[int, BlockNumber, HexStr], int] = {}
+
 
 class NetworkValidatorsProcessor(EventProcessor):
     contract_event = 'DepositEvent'
@@ -24,7 +37,7 @@ class NetworkValidatorsProcessor(EventProcessor):
         return validators_registry_contract
 
     async def get_from_block(self) -> BlockNumber:
-        last_validator = NetworkValidatorCrud().get_last_network_validator()
+        last_validator = await AsyncNetworkValidatorCrud().get_last_network_validator()
         if not last_validator:
             raise RuntimeError('network validators are missing')
 
@@ -32,68 +45,206 @@ class NetworkValidatorsProcessor(EventProcessor):
 
     # pylint: disable-next=unused-argument
     async def process_events(self, events: list[EventData], to_block: BlockNumber) -> None:
-        validators = process_network_validator_events(events)
-        NetworkValidatorCrud().save_network_validators(validators)
+        if not events:
+            return
+
+        start_time = time.time()
+        validators = await verify_network_validator_events(events)
+        elapsed = time.time() - start_time
+        logger.info(
+            'Verified %d deposit signatures in %.2f seconds (%.0f deposits/s)',
+            len(events),
+            elapsed,
+            len(events) / max(elapsed, 1e-6),
+        )
+        await AsyncNetworkValidatorCrud().save_network_validators(validators)
 
 
-def process_network_validator_events(events: list[EventData]) -> list[NetworkValidator]:
+async def verify_network_validator_events(events: list[EventData]) -> list[NetworkValidator]:
     """
-    Processes `ValidatorsRegistry` registration events
-    and returns the list of valid validators.
+    Processes `ValidatorsRegistry` registration events and returns valid validators.
+    Deposit signatures are verified in chunks across the process pool,
+    validators are kept in the events order.
     """
+    if not events:
+        return []
+
+    deposits = [get_deposit_data(event) for event in events]
+    chunk_size = settings.deposit_verification_chunk_size
+    chunks_results = await asyncio.gather(
+        *(
+            process_pool.run(verify_deposits, deposits[i : i + chunk_size])
+            for i in range(0, len(deposits), chunk_size)
+        )
+    )
     result: list[NetworkValidator] = []
-    for event in events:
-        public_key = process_network_validator_event(event)
-        if not public_key:
+    for event, is_valid in zip(events, itertools.chain.from_iterable(chunks_results)):
+        if not is_valid:
             continue
 
         result.append(
-            NetworkValidator(public_key=public_key, block_number=BlockNumber(event['blockNumber']))
+            NetworkValidator(
+                public_key=Web3.to_hex(event['args']['pubkey']),
+                block_number=BlockNumber(event['blockNumber']),
+            )
         )
 
     return result
 
 
-def process_network_validator_event(event: EventData) -> HexStr | None:
-    """
-    Processes validator deposit event
-    and returns its public key if the deposit is valid.
-    """
-    public_key = event['args']['pubkey']
-    withdrawal_creds = event['args']['withdrawal_credentials']
-    amount_gwei = struct.unpack('<Q', event['args']['amount'])[0]
-    signature = event['args']['signature']
-    fork_version = settings.network_config.GENESIS_FORK_VERSION
-    if is_valid_deposit_data_signature(
-        public_key, withdrawal_creds, signature, amount_gwei, fork_version
-    ):
-        return Web3.to_hex(public_key)
+def get_deposit_data(event: EventData) -> tuple[bytes, bytes, bytes, int]:
+    """Returns public key, withdrawal credentials, signature and amount in Gwei."""
+    return (
+        event['args']['pubkey'],
+        event['args']['withdrawal_credentials'],
+        event['args']['signature'],
+        struct.unpack('<Q', event['args']['amount'])[0],
+    )
 
-    return None
+
+def verify_deposits(deposits: list[tuple[bytes, bytes, bytes, int]]) -> list[bool]:
+    """Verifies deposit signatures. Called in the process pool workers."""
+    fork_version = settings.network_config.GENESIS_FORK_VERSION
+    return [
+        is_valid_deposit_data_signature(
+            public_key, withdrawal_creds, signature, amount_gwei, fork_version
+        )
+        for public_key, withdrawal_creds, signature, amount_gwei in deposits
+    ]
 
 
 async def get_latest_network_validator_public_keys() -> Set[HexStr]:
-    """Fetches the latest network validator public keys."""
-    last_validator = NetworkValidatorCrud().get_last_network_validator()
+    """
+    Fetches the latest network validator public keys.
+    Uses network validators tail if it's fresh.
+    """
+    tail = AppState().network_validators_tail
+    if tail is not None and is_network_validators_tail_fresh(tail):
+        return set(tail.public_keys)
+
+    if settings.validators_tail_stale_mode == settings.VALIDATORS_TAIL_MODE_WAIT:
+        try:
+            await asyncio.wait_for(
+                network_validators_tail_updated.wait(), timeout=settings.validators_tail_max_age
+            )
+        except asyncio.TimeoutError:
+            # stale tail may miss deposits, the start index must count them
+            logger.warning('Network validators tail is not updated, fetching deposits')
+        else:
+            tail = AppState().network_validators_tail
+            if tail is not None and is_network_validators_tail_fresh(tail):
+                return set(tail.public_keys)
+
+    logger.debug('Network validators tail is stale, fetching deposits from execution node')
+    return await fetch_latest_network_validator_public_keys()
+
+
+async def fetch_latest_network_validator_public_keys() -> Set[HexStr]:
+    """Fetches the latest network validator public keys from the execution node."""
+    last_validator = await AsyncNetworkValidatorCrud().get_last_network_validator()
     if last_validator:
         from_block = BlockNumber(last_validator.block_number + 1)
     else:
         raise RuntimeError('network validators are missing')
 
     event_cls = cast(type[AsyncContractEvent], validators_registry_contract.events.DepositEvent)
-    new_events = await event_cls.get_logs(from_block=from_block)
-    new_public_keys: Set[HexStr] = set()
-    for event in new_events:
-        public_key = process_network_validator_event(event)
-        if public_key:
-            new_public_keys.add(public_key)
+    new_events = await get_event_logs(event_cls, from_block=from_block)
+    new_validators = await verify_network_validator_events(new_events)
+
+    return {validator.public_key for validator in new_validators}
 
-    return new_public_keys
+
+def is_network_validators_tail_fresh(tail: NetworkValidatorsTail) -> bool:
+    return time.time() - tail.updated_at <= settings.validators_tail_max_age
+
+
+async def update_network_validators_tail(head: BlockData | None = None) -> None:
+    """
+    Updates valid public keys deposited after the last saved network validator
+    up to the `head` block, latest block by default.
+    Fetches deposits from new blocks only. Rebuilds the tail on chain reorg.
+    """
+    app_state = AppState()
+    last_validator = await AsyncNetworkValidatorCrud().get_last_network_validator()
+    if not last_validator:
+        raise RuntimeError('network validators are missing')
+
+    from_block = BlockNumber(last_validator.block_number + 1)
+    if head is None:
+        head = await execution_client.eth.get_block('latest')
+
+    tail = app_state.network_validators_tail
+    if tail is not None and not await is_network_validators_tail_canonical(tail):
+        logger.info(
+            'Chain reorg detected at block %d, rebuilding network validators tail', tail.to_block
+        )
+        tail = None
+
+    if tail is None:
+        to_block = BlockNumber(from_block - 1)
+        public_keys: dict[HexStr, BlockNumber] = {}
+    else:
+        # validators below `from_block` are saved to the database
+        to_block = tail.to_block
+        public_keys = {k: b for k, b in tail.public_keys.items() if b >= from_block}
+
+    if head['number'] > to_block:
+        event_cls = cast(type[AsyncContractEvent], validators_registry_contract.events.DepositEvent)
+        events = await get_event_logs(
+            event_cls, from_block=BlockNumber(to_block + 1), to_block=head['number']
+        )
+        for validator in await verify_network_validator_events(events):
+            public_keys.setdefault(validator.public_key, validator.block_number)
+
+    app_state.network_validators_tail = NetworkValidatorsTail(
+        from_block=from_block,
+        to_block=head['number'],
+        to_block_hash=Web3.to_hex(head['hash']),
+        public_keys=public_keys,
+        updated_at=time.time(),
+    )
+    network_validators_tail_updated.set()
+    network_validators_tail_updated.clear()
+
+
+def refresh_network_validators_tail(execution_block: BlockData) -> None:
+    """Marks the tail fresh if the execution head hasn't changed since the tail update."""
+    tail = AppState().network_validators_tail
+    if tail is not None and tail.to_block_hash == Web3.to_hex(execution_block['hash']):
+        tail.updated_at = time.time()
+
+
+async def is_network_validators_tail_canonical(tail: NetworkValidatorsTail) -> bool:
+    try:
+        block = await execution_client.eth.get_block(tail.to_block)
+    except BlockNotFound:
+        return False
+    return Web3.to_hex(block['hash']) == tail.to_block_hash
 
 
 async def get_validators_start_index() -> int:
+    """
+    Start index is reused while validators count and the fresh network validators tail
+    are unchanged, so repeated requests don't query the database.
+    """
+    cache_key = _get_validators_start_index_key()
+    if cache_key is not None and cache_key in _validators_start_indexes:
+        return _validators_start_indexes[cache_key]
+
     latest_public_keys = await get_latest_network_validator_public_keys()
-    validators_start_index = NetworkValidatorCrud().get_next_validator_index(
+    validators_start_index = await AsyncNetworkValidatorCrud().get_next_validator_index(
         list(latest_public_keys)
     )
+    # a new deposit may be processed while the index is calculated
+    if cache_key is not None and cache_key == _get_validators_start_index_key():
+        _validators_start_indexes.clear()
+        _validators_start_indexes[cache_key] = validators_start_index
     return validators_start_index
+
+
+def _get_validators_start_index_key() -> tuple[int, BlockNumber, HexStr] | None:
+    tail = AppState().network_validators_tail
+    validators_count = NetworkValidatorCrud.get_cached_validators_count()
+    if tail is None or validators_count is None or not is_network_validators_tail_fresh(tail):
+        return None
+    return validators_count, tail.from_block, tail.to_block_hash
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+
+from eth_typing import HexStr
+from sw_utils import ConsensusFork, get_exit_message_signing_root
+
+from src.common import metrics
+from src.config import settings
+
+
+@dataclass
+class ExitMessage:
+    signing_root: bytes
+    # compressed `hash_to_G2(signing_root)`, filled after the first hashing
+    message_g2: bytes | None = None
+
+
+class ExitMessageCache:
+    """
+    LRU cache of exit message signing roots and their G2 hashes.
+    Both depend on validator index, fork and genesis validators root only.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._messages: OrderedDict[tuple, ExitMessage] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def get(
+        self,
+        validator_index: int,
+        fork: ConsensusFork | None = None,
+        genesis_validators_root: HexStr | None = None,
+    ) -> ExitMessage:
+        fork = fork or settings.network_config.SHAPELLA_FORK
+        genesis_validators_root = (
+            genesis_validators_root or settings.network_config.GENESIS_VALIDATORS_ROOT
+        )
+        key = (validator_index, fork.version, fork.epoch, genesis_validators_root)
+
+        message = self._messages.get(key)
+        if message is not None:
+            metrics.exit_message_cache_hits.inc()
+            self._messages.move_to_end(key)
+            return message
+
+        metrics.exit_message_cache_misses.inc()
+        message = ExitMessage(
+            signing_root=get_exit_message_signing_root(
+                validator_index=validator_index,
+                genesis_validators_root=genesis_validators_root,
+                fork=fork,
+            )
+        )
+        self._messages[key] = message
+        while len(self._messages) > self.max_size:
+            self._messages.popitem(last=False)
+        return message
+
+    def evict(self, validator_indexes: Iterable[int]) -> None:
+        """Removes messages of the given validator indexes for all forks."""
+        validator_indexes = set(validator_indexes)
+        for key in [key for key in self._messages if key[0] in validator_indexes]:
+            del self._messages[key]
+
+
+exit_message_cache = ExitMessageCache(settings.exit_message_cache_size)
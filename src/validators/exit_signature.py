@@ -1,51 +1,187 @@
+import asyncio
+import time
+from typing import cast
+
 import ecies
-import milagro_bls_binding as bls
 from eth_typing import BLSPubkey, BLSSignature, HexStr
-from sw_utils import ConsensusFork, get_exit_message_signing_root
+from prometheus_client import Histogram
 from web3 import Web3
 
 from src.app_state import AppState
+from src.common import metrics
+from src.common.process_pool import process_pool
 from src.config import settings
-from src.validators.key_shares import bls_signature_and_public_key_to_shares
-from src.validators.typings import OraclesExitSignatureShares
+from src.validators.bls_backends import get_bls_backend, verify_signatures
+from src.validators.exit_messages import ExitMessage, exit_message_cache
+from src.validators.journal import validators_journal
+from src.validators.key_shares import (
+    bls_signature_and_public_key_to_shares,
+    reconstruct_shared_bls_signature,
+)
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+
+async def process_exit_signature_shares(validators: list[Validator]) -> None:
+    """
+    Reconstructs validators' exit signatures from DVT operators' shares,
+    verifies them in batch and splits them to oracles' shares.
+    CPU-bound work runs in the process pool if it's enabled.
+    """
+    protocol_config = AppState().protocol_config
+    oracle_public_keys = [oracle.public_key for oracle in protocol_config.oracles]
+    exit_messages = [exit_message_cache.get(v.validator_index) for v in validators]
+
+    await hash_missing_exit_messages(exit_messages)
+
+    reconstructed = await asyncio.gather(
+        *(
+            process_pool.run_timed(reconstruct_exit_signature, dict(v.exit_signature_shares))
+            for v in validators
+        )
+    )
+    exit_signatures = [exit_signature for exit_signature, _ in reconstructed]
+    for _, reconstruct_time in reconstructed:
+        metrics.reconstruct_duration.observe(reconstruct_time)
+
+    validity, verify_time = await process_pool.run_timed(
+        validate_exit_signatures,
+        [v.public_key for v in validators],
+        [m.signing_root for m in exit_messages],
+        [cast(bytes, m.message_g2) for m in exit_messages],
+        exit_signatures,
+    )
+    observe_per_validator(metrics.verify_duration, verify_time, len(validators))
+    valid_validators = [
+        (v, exit_message, exit_signature)
+        for v, exit_message, exit_signature, is_valid in zip(
+            validators, exit_messages, exit_signatures, validity
+        )
+        if is_valid
+    ]
+    oracles_shares = await asyncio.gather(
+        *(
+            process_pool.run(
+                get_oracles_exit_signature_shares,
+                v.public_key,
+                exit_message,
+                exit_signature,
+                oracle_public_keys,
+                protocol_config.exit_signature_recover_threshold,
+            )
+            for v, exit_message, exit_signature in valid_validators
+        )
+    )
+    observe_oracles_shares_timings(oracles_shares)
+    save_exit_signatures(
+        [
+            (v, exit_signature, oracles_exit_signature_shares)
+            for (v, _, exit_signature), (oracles_exit_signature_shares, _, _) in zip(
+                valid_validators, oracles_shares
+            )
+        ]
+    )
+
+    if len(valid_validators) < len(validators):
+        raise RuntimeError('invalid exit signature')
+
+
+async def hash_missing_exit_messages(exit_messages: list[ExitMessage]) -> None:
+    """Fills G2 hashes of the messages missing in the cache."""
+    missing_messages = list({id(m): m for m in exit_messages if m.message_g2 is None}.values())
+    if not missing_messages:
+        return
+
+    messages_g2, hash_time = await process_pool.run_timed(
+        hash_exit_messages, [m.signing_root for m in missing_messages]
+    )
+    observe_per_validator(metrics.hash_exit_message_duration, hash_time, len(messages_g2))
+    for exit_message, message_g2 in zip(missing_messages, messages_g2):
+        exit_message.message_g2 = message_g2
+
+
+def save_exit_signatures(
+    exit_signatures: list[tuple[Validator, BLSSignature, OraclesExitSignatureShares]]
+) -> None:
+    app_state = AppState()
+    updated_validators = []
+    for v, exit_signature, oracles_exit_signature_shares in exit_signatures:
+        # validator may be replaced with a new index while its signature is processed
+        if app_state.validators.get(v.public_key) is not v:
+            continue
+        v.exit_signature = exit_signature
+        v.oracles_exit_signature_shares = oracles_exit_signature_shares
+        app_state.validators.touch(v.public_key)
+        updated_validators.append(v)
+    validators_journal.add_exit_signatures(updated_validators)
+
+
+def observe_per_validator(histogram: Histogram, batch_time: float, count: int) -> None:
+    """Batch time is shared equally by the validators, stages are compared per validator."""
+    for _ in range(count):
+        histogram.observe(batch_time / count)
+
+
+def observe_oracles_shares_timings(
+    oracles_shares: list[tuple[OraclesExitSignatureShares, float, float]]
+) -> None:
+    for _, split_time, encrypt_time in oracles_shares:
+        metrics.split_duration.observe(split_time)
+        metrics.encrypt_duration.observe(encrypt_time)
+
+
+def hash_exit_messages(signing_roots: list[bytes]) -> list[bytes]:
+    backend = get_bls_backend(settings.bls_backend)
+    return [backend.G2_to_signature(backend.hash_to_G2(root)) for root in signing_roots]
+
+
+def reconstruct_exit_signature(exit_signature_shares: dict[int, BLSSignature]) -> BLSSignature:
+    return reconstruct_shared_bls_signature(
+        exit_signature_shares, backend=get_bls_backend(settings.bls_backend)
+    )
 
 
-async def get_oracles_exit_signature_shares(
+def get_oracles_exit_signature_shares(
     public_key: HexStr,
-    validator_index: int,
+    exit_message: ExitMessage,
     exit_signature: BLSSignature,
-    fork: ConsensusFork | None = None,
-) -> OraclesExitSignatureShares:
+    oracle_public_keys: list[HexStr],
+    threshold: int,
+) -> tuple[OraclesExitSignatureShares, float, float]:
     """
     * generates exit signature shards,
     * generates public key shards
     * encrypts exit signature shards with oracles' public keys.
-    """
-    fork = fork or settings.network_config.SHAPELLA_FORK
-    app_state = AppState()
-    protocol_config = app_state.protocol_config
-    oracle_public_keys = [oracle.public_key for oracle in protocol_config.oracles]
-    message = get_exit_message_signing_root(
-        validator_index=validator_index,
-        genesis_validators_root=settings.network_config.GENESIS_VALIDATORS_ROOT,
-        fork=fork,
-    )
 
+    Also returns the time of splitting and encryption,
+    metrics can't be updated in the process pool workers.
+    """
+    start_time = time.perf_counter()
     public_key_bytes = BLSPubkey(Web3.to_bytes(hexstr=public_key))
-    threshold = protocol_config.exit_signature_recover_threshold
-    total = len(protocol_config.oracles)
+    total = len(oracle_public_keys)
 
     exit_signature_shares, public_key_shares = bls_signature_and_public_key_to_shares(
-        message, exit_signature, public_key_bytes, threshold, total
+        exit_message.signing_root,
+        exit_signature,
+        public_key_bytes,
+        threshold,
+        total,
+        message_g2=exit_message.message_g2,
+        backend=get_bls_backend(settings.bls_backend),
     )
 
+    split_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
     encrypted_exit_signature_shares = encrypt_signatures_list(
         oracle_public_keys, exit_signature_shares
     )
-    return OraclesExitSignatureShares(
+    encrypt_time = time.perf_counter() - start_time
+
+    oracles_exit_signature_shares = OraclesExitSignatureShares(
         public_keys=[Web3.to_hex(p) for p in public_key_shares],
         encrypted_exit_signatures=encrypted_exit_signature_shares,
     )
+    return oracles_exit_signature_shares, split_time, encrypt_time
 
 
 def encrypt_signatures_list(
@@ -61,18 +197,22 @@ def encrypt_signature(oracle_pubkey: HexStr, signature: BLSSignature) -> HexStr:
     return Web3.to_hex(ecies.encrypt(oracle_pubkey, signature))
 
 
-def validate_exit_signature(
-    public_key: HexStr,
-    validator_index: int,
-    exit_signature: BLSSignature,
-) -> bool:
-    genesis_validators_root = settings.network_config.GENESIS_VALIDATORS_ROOT
-    fork = settings.network_config.SHAPELLA_FORK
-
-    message = get_exit_message_signing_root(
-        validator_index=validator_index,
-        genesis_validators_root=genesis_validators_root,
-        fork=fork,
+def validate_exit_signatures(
+    public_keys: list[HexStr],
+    messages: list[bytes],
+    messages_g2: list[bytes],
+    exit_signatures: list[BLSSignature],
+) -> list[bool]:
+    """Verifies exit signatures in batch, see `verify_signatures`."""
+    return verify_signatures(
+        [BLSPubkey(Web3.to_bytes(hexstr=p)) for p in public_keys],
+        messages,
+        exit_signatures,
+        messages_g2,
+        backend=get_bls_backend(settings.bls_backend),
     )
 
-    return bls.Verify(Web3.to_bytes(hexstr=public_key), message, exit_signature)
+
+def init_crypto_worker() -> None:
+    """Process pool worker initializer. Prepares BLS backend before the first job."""
+    get_bls_backend(settings.bls_backend)
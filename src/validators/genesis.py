@@ -0,0 +1,94 @@
+import logging
+from typing import AsyncIterator
+
+import aiohttp
+from eth_typing import BlockNumber
+from sw_utils import IpfsFetchClient
+
+from src.validators.typings import NetworkValidatorRow
+
+logger = logging.getLogger(__name__)
+
+# 4 bytes of block number followed by 48 bytes of public key
+GENESIS_VALIDATOR_RECORD_SIZE = 52
+
+IPFS_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def parse_genesis_validators(data: memoryview) -> list[NetworkValidatorRow]:
+    """
+    Parses `(public_key, block_number)` rows with raw public keys.
+    Slices of memoryview don't copy data, the keys are copied once to be saved as they are.
+    """
+    return [
+        (
+            bytes(data[i + 4 : i + GENESIS_VALIDATOR_RECORD_SIZE]),
+            BlockNumber(int.from_bytes(data[i : i + 4], 'big')),
+        )
+        for i in range(0, len(data), GENESIS_VALIDATOR_RECORD_SIZE)
+    ]
+
+
+async def iter_genesis_validator_batches(
+    chunks: AsyncIterator[bytes], batch_size: int
+) -> AsyncIterator[list[NetworkValidatorRow]]:
+    """
+    Groups the dump chunks into batches of `batch_size` validators.
+    Only one batch and the current chunk are kept in memory.
+    """
+    batch_bytes = batch_size * GENESIS_VALIDATOR_RECORD_SIZE
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) < batch_bytes:
+            continue
+
+        size = len(buffer) - len(buffer) % batch_bytes
+        with memoryview(buffer) as view:
+            for i in range(0, size, batch_bytes):
+                yield parse_genesis_validators(view[i : i + batch_bytes])
+        del buffer[:size]
+
+    if len(buffer) % GENESIS_VALIDATOR_RECORD_SIZE:
+        raise ValueError('Invalid genesis validators dump size')
+    if buffer:
+        with memoryview(buffer) as view:
+            yield parse_genesis_validators(view)
+
+
+async def stream_genesis_validators(
+    ipfs_hash: str, ipfs_endpoints: list[str], timeout: int, retry_timeout: int
+) -> AsyncIterator[bytes]:
+    """
+    Streams the dump from the first available IPFS gateway.
+    Falls back to the full download with `IpfsFetchClient`
+    if no gateway can be streamed from.
+    """
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    for endpoint in ipfs_endpoints:
+        if not endpoint.startswith('http'):
+            continue
+        is_started = False
+        try:
+            async with aiohttp.ClientSession(timeout=client_timeout) as session:
+                url = f"{endpoint.rstrip('/')}/ipfs/{ipfs_hash}"
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(IPFS_STREAM_CHUNK_SIZE):
+                        is_started = True
+                        yield chunk
+            return
+        except (aiohttp.ClientError, TimeoutError) as e:
+            # part of the dump is already consumed, can't switch the endpoint
+            if is_started:
+                raise
+            logger.warning('Failed to stream genesis validators from %s: %s', endpoint, e)
+
+    ipfs_fetch_client = IpfsFetchClient(
+        ipfs_endpoints=ipfs_endpoints,
+        timeout=timeout,
+        retry_timeout=retry_timeout,
+    )
+    data = await ipfs_fetch_client.fetch_bytes(ipfs_hash)
+    for i in range(0, len(data), IPFS_STREAM_CHUNK_SIZE):
+        yield data[i : i + IPFS_STREAM_CHUNK_SIZE]
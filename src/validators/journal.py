@@ -0,0 +1,204 @@
+"""
+Append-only journal of in-flight validators.
+Every change of `AppState.validators` is appended as a JSON line,
+on startup the journal is replayed to restore validators that are not expired.
+The journal contains exit signatures and their shares, it's readable by the owner only.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from time import time
+from typing import IO, Iterable
+
+from eth_typing import BLSSignature, HexStr
+
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+logger = logging.getLogger(__name__)
+
+RECORD_VALIDATOR = 'validator'
+RECORD_EXIT_SIGNATURE_SHARE = 'exit_signature_share'
+RECORD_EXIT_SIGNATURE = 'exit_signature'
+
+JOURNAL_FILE_MODE = 0o600
+
+
+class ValidatorsJournal:
+    """Journal is disabled until `setup` is called with a file path."""
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.compaction_records = 0
+        # records appended since the last compaction
+        self.records_count = 0
+        self._file: IO[str] | None = None
+
+    def setup(
+        self, path: str, validator_lifetime: int, compaction_records: int
+    ) -> dict[HexStr, Validator]:
+        """Replays the journal and opens it for appending. Returns restored validators."""
+        self.path = Path(path)
+        self.compaction_records = compaction_records
+
+        validators: dict[HexStr, Validator] = {}
+        if self.path.exists():
+            validators = self.replay(self.path)
+
+        now = int(time())
+        validators = {
+            public_key: v
+            for public_key, v in validators.items()
+            if now - v.created_at <= validator_lifetime
+        }
+        self.compact(validators.values())
+        logger.info('Restored %d validators from the journal', len(validators))
+        return validators
+
+    @staticmethod
+    def replay(path: Path) -> dict[HexStr, Validator]:
+        validators: dict[HexStr, Validator] = {}
+        with path.open(encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # the last line may be partially written on crash
+                    logger.warning('Skipping invalid journal record')
+                    continue
+                apply_record(validators, record)
+        return validators
+
+    def add_validators(self, validators: Iterable[Validator]) -> None:
+        self._append([validator_record(v) for v in validators])
+
+    def add_exit_signature_shares(self, shares: Iterable[tuple[HexStr, int, BLSSignature]]) -> None:
+        self._append(
+            [
+                exit_signature_share_record(public_key, share_index, share)
+                for public_key, share_index, share in shares
+            ]
+        )
+
+    def add_exit_signatures(self, validators: Iterable[Validator]) -> None:
+        self._append([exit_signature_record(v) for v in validators])
+
+    def compact_if_needed(self, validators: Iterable[Validator]) -> None:
+        if self.records_count >= self.compaction_records:
+            self.compact(validators)
+
+    def compact(self, validators: Iterable[Validator]) -> None:
+        """Rewrites the journal with the current state of validators only."""
+        if self.path is None:
+            return
+
+        records = []
+        for v in validators:
+            records.append(validator_record(v))
+            records.extend(
+                exit_signature_share_record(v.public_key, share_index, share)
+                for share_index, share in v.exit_signature_shares.items()
+            )
+            if v.exit_signature is not None:
+                records.append(exit_signature_record(v))
+
+        tmp_path = self.path.with_name(f'{self.path.name}.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, JOURNAL_FILE_MODE)
+        # the file may be left by an interrupted compaction with other permissions
+        os.fchmod(fd, JOURNAL_FILE_MODE)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(record) + '\n' for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.close()
+        tmp_path.replace(self.path)
+        # kept open for appending until the next compaction
+        self._file = self.path.open('a', encoding='utf-8')  # pylint: disable=consider-using-with
+        self.records_count = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, records: list[dict]) -> None:
+        if self._file is None or not records:
+            return
+
+        # single write per request, flushed to survive process restart
+        self._file.write(''.join(json.dumps(record) + '\n' for record in records))
+        self._file.flush()
+        self.records_count += len(records)
+
+
+def validator_record(validator: Validator) -> dict:
+    return {
+        'type': RECORD_VALIDATOR,
+        'public_key': validator.public_key,
+        'validator_index': validator.validator_index,
+        'created_at': validator.created_at,
+    }
+
+
+def exit_signature_share_record(
+    public_key: HexStr, share_index: int, exit_signature_share: BLSSignature
+) -> dict:
+    return {
+        'type': RECORD_EXIT_SIGNATURE_SHARE,
+        'public_key': public_key,
+        'share_index': share_index,
+        'exit_signature_share': exit_signature_share.hex(),
+    }
+
+
+def exit_signature_record(validator: Validator) -> dict:
+    record: dict = {
+        'type': RECORD_EXIT_SIGNATURE,
+        'public_key': validator.public_key,
+        'validator_index': validator.validator_index,
+        'exit_signature': validator.exit_signature.hex() if validator.exit_signature else None,
+        'oracles_exit_signature_shares': None,
+    }
+    if validator.oracles_exit_signature_shares is not None:
+        record['oracles_exit_signature_shares'] = {
+            'public_keys': validator.oracles_exit_signature_shares.public_keys,
+            'encrypted_exit_signatures': (
+                validator.oracles_exit_signature_shares.encrypted_exit_signatures
+            ),
+        }
+    return record
+
+
+def apply_record(validators: dict[HexStr, Validator], record: dict) -> None:
+    public_key = record['public_key']
+    if record['type'] == RECORD_VALIDATOR:
+        # validator is replaced when its index changes
+        validators[public_key] = Validator(
+            public_key=public_key,
+            validator_index=record['validator_index'],
+            created_at=record['created_at'],
+        )
+        return
+
+    validator = validators.get(public_key)
+    if validator is None:
+        return
+
+    if record['type'] == RECORD_EXIT_SIGNATURE_SHARE:
+        validator.exit_signature_shares[record['share_index']] = BLSSignature(
+            bytes.fromhex(record['exit_signature_share'])
+        )
+    elif record['type'] == RECORD_EXIT_SIGNATURE:
+        # exit signature of the replaced validator, signed for the previous index
+        if record['validator_index'] != validator.validator_index:
+            return
+        if record['exit_signature'] is not None:
+            validator.exit_signature = BLSSignature(bytes.fromhex(record['exit_signature']))
+        if record['oracles_exit_signature_shares'] is not None:
+            validator.oracles_exit_signature_shares = OraclesExitSignatureShares(
+                **record['oracles_exit_signature_shares']
+            )
+
+
+validators_journal = ValidatorsJournal()
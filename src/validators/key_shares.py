@@ -1,37 +1,30 @@
 import secrets
-from typing import TypeAlias
 
 from eth_typing import BLSPubkey, BLSSignature
-from py_ecc.bls import G2ProofOfPossession
-from py_ecc.bls.g2_primitives import (
-    G1_to_pubkey,
-    G2_to_signature,
-    pubkey_to_G1,
-    signature_to_G2,
-)
-from py_ecc.bls.hash_to_curve import hash_to_G2
-from py_ecc.optimized_bls12_381.optimized_curve import (
-    G1 as P1,  # don't confuse group name (G1) with primitive element name (P1)
-)
-from py_ecc.optimized_bls12_381.optimized_curve import Z2, add, curve_order, multiply
-from py_ecc.typing import Optimized_Field, Optimized_Point3D
+from py_ecc.optimized_bls12_381.optimized_curve import curve_order
 from py_ecc.utils import prime_field_inv
 
-# element of G1 or G2
-G12: TypeAlias = Optimized_Point3D[Optimized_Field]
+from src.validators.bls_backends import BLSBackend, PyEccBLSBackend, get_bls_backend
 
+# Points passed to the helpers below are created by py_ecc unless other backend is given
+py_ecc_backend = PyEccBLSBackend()
 
-def get_G12_polynomial_points(coefficients: list, num_points: int) -> list:
-    """Calculates polynomial points in G1 or G2."""
+
+def get_G12_polynomial_points(
+    coefficients: list, num_points: int, backend: BLSBackend = py_ecc_backend
+) -> list:
+    """
+    Calculates polynomial points in G1 or G2.
+    Uses Horner's scheme `y = c0 + x * (c1 + x * (c2 + ...))`,
+    so every point costs multiplications by the small scalar `x` only
+    instead of full-size scalar multiplications by `x**i`.
+    """
     points = []
     for x in range(1, num_points + 1):
-        # start with x=1 and calculate the value of y
-        y = coefficients[0]
-        # calculate each term and add it to y, using modular math
-        for i in range(1, len(coefficients)):
-            exponentiation = (x**i) % curve_order
-            term = multiply(coefficients[i], exponentiation)
-            y = add(y, term)
+        # start with the highest coefficient and fold the rest in descending order
+        y = coefficients[-1]
+        for coefficient in reversed(coefficients[:-1]):
+            y = backend.add(backend.multiply(y, x), coefficient)
 
         # add the point to the list of points
         points.append(y)
@@ -40,30 +33,40 @@ def get_G12_polynomial_points(coefficients: list, num_points: int) -> list:
 
 def bls_signature_to_shares(
     bls_signature: BLSSignature,
-    coefficients_G2: list[G12],
+    coefficients_G2: list,
     total: int,
+    backend: BLSBackend = py_ecc_backend,
 ) -> list[BLSSignature]:
-    coefficients_G2 = [signature_to_G2(bls_signature)] + coefficients_G2
+    coefficients_G2 = [backend.signature_to_G2(bls_signature)] + coefficients_G2
 
-    points = get_G12_polynomial_points(coefficients_G2, total)
+    points = get_G12_polynomial_points(coefficients_G2, total, backend)
 
-    return [BLSSignature(G2_to_signature(p)) for p in points]
+    return [backend.G2_to_signature(p) for p in points]
 
 
 def bls_public_key_to_shares(
     public_key: BLSPubkey,
     coefficients_G1: list,
     total: int,
+    backend: BLSBackend = py_ecc_backend,
 ) -> list[BLSPubkey]:
-    coefficients_G1 = [pubkey_to_G1(public_key)] + coefficients_G1
+    coefficients_G1 = [backend.pubkey_to_G1(public_key)] + coefficients_G1
 
-    points = get_G12_polynomial_points(coefficients_G1, total)
+    points = get_G12_polynomial_points(coefficients_G1, total, backend)
 
-    return [BLSPubkey(G1_to_pubkey(p)) for p in points]
+    return [backend.G1_to_pubkey(p) for p in points]
 
 
+# pylint: disable-next=too-many-arguments
 def bls_signature_and_public_key_to_shares(
-    message: bytes, signature: BLSSignature, public_key: BLSPubkey, threshold: int, total: int
+    message: bytes,
+    signature: BLSSignature,
+    public_key: BLSPubkey,
+    threshold: int,
+    total: int,
+    *,
+    message_g2: bytes | None = None,
+    backend: BLSBackend | None = None,
 ) -> tuple[list[BLSSignature], list[BLSPubkey]]:
     """
     Given `message`, `signature` and `public_key` so that
@@ -71,34 +74,64 @@ def bls_signature_and_public_key_to_shares(
 
     The function splits `signature` and `public_key` to shares so that
     each signature share can be verified with corresponding public key share.
+
+    `message_g2` is compressed `hash_to_G2(message)` if it's already known.
     """
-    message_g2 = hash_to_G2(
-        message, G2ProofOfPossession.DST, G2ProofOfPossession.xmd_hash_function  # type: ignore
+    coefficients = [secrets.randbelow(curve_order) for _ in range(threshold - 1)]
+
+    return bls_signature_and_public_key_to_shares_with_coefficients(
+        message, signature, public_key, coefficients, total, message_g2=message_g2, backend=backend
     )
 
-    coefficients_int = [secrets.randbelow(curve_order) for _ in range(threshold - 1)]
-    coefficients_G1 = [multiply(P1, coef) for coef in coefficients_int]
-    coefficients_G2 = [multiply(message_g2, coef) for coef in coefficients_int]
 
-    bls_signature_shards = bls_signature_to_shares(signature, coefficients_G2, total)
-    public_key_shards = bls_public_key_to_shares(public_key, coefficients_G1, total)
+# pylint: disable-next=too-many-arguments
+def bls_signature_and_public_key_to_shares_with_coefficients(
+    message: bytes,
+    signature: BLSSignature,
+    public_key: BLSPubkey,
+    coefficients: list[int],
+    total: int,
+    *,
+    message_g2: bytes | None = None,
+    backend: BLSBackend | None = None,
+) -> tuple[list[BLSSignature], list[BLSPubkey]]:
+    """
+    Same as `bls_signature_and_public_key_to_shares` but with the given
+    polynomial coefficients. The result is the same for every backend.
+    """
+    backend = backend or get_bls_backend()
+    if message_g2 is None:
+        message_point = backend.hash_to_G2(message)
+    else:
+        message_point = backend.signature_to_G2(BLSSignature(message_g2))
+    generator_G1 = backend.G1_generator()
+
+    coefficients_G1 = [backend.multiply(generator_G1, coef) for coef in coefficients]
+    coefficients_G2 = [backend.multiply(message_point, coef) for coef in coefficients]
+
+    bls_signature_shards = bls_signature_to_shares(signature, coefficients_G2, total, backend)
+    public_key_shards = bls_public_key_to_shares(public_key, coefficients_G1, total, backend)
 
     return bls_signature_shards, public_key_shards
 
 
-def reconstruct_shared_bls_signature(signatures: dict[int, BLSSignature]) -> BLSSignature:
+def reconstruct_shared_bls_signature(
+    signatures: dict[int, BLSSignature], backend: BLSBackend | None = None
+) -> BLSSignature:
     """
     Reconstructs shared BLS private key signature.
     Copied from https://github.com/dankrad/python-ibft/blob/master/bls_threshold.py
 
     signatures: dict[int, BLSSignature] - indexes must be 1-based (1,2,3...)
     """
-    r = Z2
+    backend = backend or get_bls_backend()
+    points = []
+    coefficients = []
     for i, sig in signatures.items():
-        sig_point = signature_to_G2(sig)
+        points.append(backend.signature_to_G2(sig))
         coef = 1
         for j in signatures:
             if j != i:
                 coef = -coef * j * prime_field_inv(i - j, curve_order) % curve_order
-        r = add(r, multiply(sig_point, coef))
-    return G2_to_signature(r)
+        coefficients.append(coef)
+    return backend.G2_to_signature(backend.multiexp(points, coefficients))
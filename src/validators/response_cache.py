@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+from eth_typing import HexStr
+
+from src.validators.store import ValidatorsStore
+
+CacheKey = tuple[tuple[HexStr, ...], int]
+
+
+class ValidatorsResponseCache:
+    """
+    Serialized `POST /validators` responses by requested public keys and validators start index.
+    Response is valid while store versions of the requested validators are unchanged:
+    new exit signature share, reconstructed exit signature or replaced validator
+    bump the version. New deposit changes the start index.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._responses: OrderedDict[CacheKey, tuple[list[int | None], bytes]] = OrderedDict()
+
+    def get(
+        self, public_keys: list[HexStr], start_index: int, store: ValidatorsStore
+    ) -> bytes | None:
+        key = (tuple(public_keys), start_index)
+        cached = self._responses.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        versions, content = cached
+        if store.get_versions(public_keys) != versions:
+            del self._responses[key]
+            self.misses += 1
+            return None
+
+        self._responses.move_to_end(key)
+        self.hits += 1
+        return content
+
+    def put(
+        self,
+        public_keys: list[HexStr],
+        start_index: int,
+        store: ValidatorsStore,
+        content: bytes,
+    ) -> None:
+        key = (tuple(public_keys), start_index)
+        self._responses[key] = (store.get_versions(public_keys), content)
+        self._responses.move_to_end(key)
+        if len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+
+validators_response_cache = ValidatorsResponseCache()
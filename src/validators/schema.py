@@ -102,3 +102,9 @@ class ExitsResponseItem(BaseModel):
 
 class ExitsResponse(BaseModel):
     exits: list[ExitsResponseItem]
+    # pass as `cursor` to get the next page, `None` on the last page
+    next_cursor: str | None = None
+    # pass as `since_version` to get the changes after this response
+    version: int = 0
+    # public keys removed since `since_version`
+    removed_public_keys: list[HexStr] = []
@@ -0,0 +1,101 @@
+"""
+Fast path for validators responses.
+Response item of a validator is serialized once after every change and cached on the validator,
+responses are assembled from the cached items. Output matches the `schema` models.
+"""
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from eth_typing import HexStr
+
+from src.validators.typings import Validator
+
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:  # pragma: no cover
+    ORJSON_INSTALLED = False
+
+CREATE_VALIDATORS_ITEM = 'create_validators_item'
+EXITS_ITEM = 'exits_item'
+
+
+def dumps(obj: Any) -> bytes:
+    if ORJSON_INSTALLED:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def get_create_validators_item(v: Validator) -> bytes:
+    """Serialized `CreateValidatorsResponseItem`."""
+    if (fragment := v.response_fragments.get(CREATE_VALIDATORS_ITEM)) is None:
+        oracles_exit_signature_shares = None
+        if shares := v.oracles_exit_signature_shares:
+            oracles_exit_signature_shares = {
+                'public_keys': shares.public_keys,
+                'encrypted_exit_signatures': shares.encrypted_exit_signatures,
+            }
+        fragment = dumps(
+            {
+                'public_key': v.public_key,
+                'oracles_exit_signature_shares': oracles_exit_signature_shares,
+            }
+        )
+        v.response_fragments[CREATE_VALIDATORS_ITEM] = fragment
+    return fragment
+
+
+def get_exits_item(v: Validator) -> bytes:
+    """Serialized `ExitsResponseItem`."""
+    if (fragment := v.response_fragments.get(EXITS_ITEM)) is None:
+        fragment = dumps(
+            {
+                'public_key': v.public_key,
+                'validator_index': v.validator_index,
+                'is_exit_signature_ready': bool(v.exit_signature),
+                'created_at_timestamp': v.created_at,
+                'created_at_string': datetime.fromtimestamp(v.created_at, timezone.utc).strftime(
+                    '%Y-%m-%d %H:%M:%S%z'
+                ),
+                'share_indexes_ready': sorted(v.exit_signature_shares),
+            }
+        )
+        v.response_fragments[EXITS_ITEM] = fragment
+    return fragment
+
+
+def serialize_create_validators_response(ready: bool, validators: Iterable[Validator]) -> bytes:
+    """Serialized `CreateValidatorsResponse`."""
+    return b''.join(
+        [
+            b'{"ready":',
+            dumps(ready),
+            b',"validators":[',
+            b','.join(get_create_validators_item(v) for v in validators),
+            b']}',
+        ]
+    )
+
+
+def serialize_exits_response(
+    validators: Iterable[Validator],
+    next_cursor: str | None,
+    version: int,
+    removed_public_keys: list[HexStr],
+) -> bytes:
+    """Serialized `ExitsResponse`."""
+    return b''.join(
+        [
+            b'{"exits":[',
+            b','.join(get_exits_item(v) for v in validators),
+            b'],"next_cursor":',
+            dumps(next_cursor),
+            b',"version":',
+            dumps(version),
+            b',"removed_public_keys":',
+            dumps(removed_public_keys),
+            b'}',
+        ]
+    )
@@ -0,0 +1,149 @@
+"""
+Binary snapshot of the network validators table.
+
+Layout: header followed by the records in the genesis validators dump format.
+Header: magic, format version, network name, validators count,
+last block number and sha256 of the records.
+"""
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from eth_typing import BlockNumber
+
+from src.common.clients import db_client
+from src.config import settings
+from src.validators.database import NetworkValidatorCrud
+from src.validators.genesis import (
+    GENESIS_VALIDATOR_RECORD_SIZE,
+    parse_genesis_validators,
+)
+from src.validators.typings import NetworkValidatorRow
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b'DVTV'
+SNAPSHOT_VERSION = 1
+
+snapshot_header = struct.Struct('>4sB16sQQ32s')
+
+
+@dataclass
+class SnapshotHeader:
+    network: str
+    validators_count: int
+    last_block_number: BlockNumber
+    checksum: bytes
+
+    def pack(self) -> bytes:
+        return snapshot_header.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            self.network.encode(),
+            self.validators_count,
+            self.last_block_number,
+            self.checksum,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> 'SnapshotHeader':
+        if len(data) != snapshot_header.size:
+            raise ValueError('Invalid snapshot: file is too short')
+        magic, version, network, count, block_number, checksum = snapshot_header.unpack(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError('Invalid snapshot: unknown file format')
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f'Invalid snapshot: unsupported version {version}')
+        return cls(
+            network=network.rstrip(b'\x00').decode(),
+            validators_count=count,
+            last_block_number=BlockNumber(block_number),
+            checksum=checksum,
+        )
+
+
+def export_validators_snapshot(path: Path, batch_size: int = 50000) -> SnapshotHeader:
+    """
+    Writes network validators to the snapshot file.
+    The file is written next to the target and renamed when complete.
+    """
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    checksum = hashlib.sha256()
+    validators_count = 0
+    last_block_number = 0
+    with tmp_path.open('wb') as f:
+        f.write(bytes(snapshot_header.size))
+
+        records = bytearray()
+        for public_key, block_number in NetworkValidatorCrud().get_network_validator_rows():
+            records += block_number.to_bytes(4, 'big')
+            records += public_key
+            validators_count += 1
+            last_block_number = max(last_block_number, block_number)
+            if validators_count % batch_size == 0:
+                checksum.update(records)
+                f.write(records)
+                records.clear()
+        checksum.update(records)
+        f.write(records)
+
+        header = SnapshotHeader(
+            network=settings.network,
+            validators_count=validators_count,
+            last_block_number=BlockNumber(last_block_number),
+            checksum=checksum.digest(),
+        )
+        f.seek(0)
+        f.write(header.pack())
+        f.flush()
+        os.fsync(f.fileno())
+
+    tmp_path.replace(path)
+    return header
+
+
+def import_validators_snapshot(path: Path, batch_size: int = 50000) -> SnapshotHeader:
+    """
+    Saves validators from the snapshot file in a single transaction.
+    Nothing is saved if the checksum doesn't match.
+    Must run in the database writer thread.
+    """
+    with path.open('rb') as f:
+        header = SnapshotHeader.unpack(f.read(snapshot_header.size))
+        if header.network != settings.network:
+            raise ValueError(
+                f'Invalid snapshot: network {header.network}, expected {settings.network}'
+            )
+
+        db_client.set_bulk_load(True)
+        try:
+            NetworkValidatorCrud().save_network_validator_batches(
+                _read_snapshot_batches(f, header, batch_size)
+            )
+        finally:
+            db_client.set_bulk_load(False)
+
+    return header
+
+
+def _read_snapshot_batches(
+    f: BinaryIO, header: SnapshotHeader, batch_size: int
+) -> Iterator[list[NetworkValidatorRow]]:
+    checksum = hashlib.sha256()
+    validators_count = 0
+    while data := f.read(batch_size * GENESIS_VALIDATOR_RECORD_SIZE):
+        if len(data) % GENESIS_VALIDATOR_RECORD_SIZE:
+            raise ValueError('Invalid snapshot: truncated record')
+        checksum.update(data)
+        with memoryview(data) as view:
+            rows = parse_genesis_validators(view)
+        validators_count += len(rows)
+        yield rows
+        logger.info('Imported %d of %d validators', validators_count, header.validators_count)
+
+    if validators_count != header.validators_count or checksum.digest() != header.checksum:
+        raise ValueError('Invalid snapshot: checksum mismatch')
@@ -0,0 +1,229 @@
+"""
+In-flight validators with ordered indexes for `/exits` pagination.
+"""
+import bisect
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator
+
+from eth_typing import HexStr
+
+from src.validators.typings import Validator
+
+# stale entries of the creation index are dropped when there are more of them than this
+INDEX_COMPACTION_THRESHOLD = 1000
+
+
+class VersionTooOldError(ValueError):
+    """Removals since the requested version are not retained anymore."""
+
+
+class CreationIndex:
+    """
+    Sorted `(created_at, sequence)` keys. Removed keys stay in the list
+    until there are more of them than `INDEX_COMPACTION_THRESHOLD` and the kept keys.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[int, int]] = []
+        self._members: set[tuple[int, int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def add(self, key: tuple[int, int]) -> None:
+        if key in self._members:
+            return
+        if not self._keys or self._keys[-1] < key:
+            self._keys.append(key)
+        else:
+            bisect.insort(self._keys, key)
+        self._members.add(key)
+
+    def discard(self, key: tuple[int, int]) -> None:
+        if key not in self._members:
+            return
+        self._members.remove(key)
+
+        stale_count = len(self._keys) - len(self._members)
+        if stale_count > max(INDEX_COMPACTION_THRESHOLD, len(self._members)):
+            self._keys = [k for k in self._keys if k in self._members]
+
+    def iter_from(
+        self, cursor: tuple[int, int] | None = None, created_since: int | None = None
+    ) -> Iterator[tuple[int, int]]:
+        """Keys after the cursor created since `created_since`."""
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(self._keys, cursor)
+        if created_since is not None:
+            start = max(start, bisect.bisect_left(self._keys, (created_since, 0)))
+
+        # no slicing, page costs the number of scanned entries
+        for i in range(start, len(self._keys)):
+            key = self._keys[i]
+            if key in self._members:
+                yield key
+
+
+# pylint: disable-next=too-many-instance-attributes
+class ValidatorsStore:
+    """
+    Validators by public key.
+    Creation index keeps validators ordered by `(created_at, sequence)`,
+    the pair is used as a page cursor. Not ready validators are indexed separately,
+    so operators polling for missing shares don't scan ready validators.
+    Every change increments the store version. Changes index keeps validators
+    ordered by the version of their last change, removed public keys are retained
+    up to `max_removed` to let clients follow changes incrementally.
+    """
+
+    def __init__(self, max_removed: int = 10000) -> None:
+        self.version = 0
+        self.max_removed = max_removed
+        self._validators: dict[HexStr, Validator] = {}
+        self._sequence = 0
+        # public key -> creation index key
+        self._index_keys: dict[HexStr, tuple[int, int]] = {}
+        self._index = CreationIndex()
+        # validators without exit signature
+        self._not_ready_index = CreationIndex()
+        self._public_keys: dict[tuple[int, int], HexStr] = {}
+        # public key -> version of the last change, ordered by version
+        self._changes: OrderedDict[HexStr, int] = OrderedDict()
+        self._removed: OrderedDict[HexStr, int] = OrderedDict()
+        # changes since older versions are incomplete
+        self._min_version = 0
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def __contains__(self, public_key: HexStr) -> bool:
+        return public_key in self._validators
+
+    def get(self, public_key: HexStr) -> Validator | None:
+        return self._validators.get(public_key)
+
+    def values(self) -> Iterable[Validator]:
+        return self._validators.values()
+
+    def items(self) -> Iterable[tuple[HexStr, Validator]]:
+        return self._validators.items()
+
+    def get_versions(self, public_keys: Iterable[HexStr]) -> list[int | None]:
+        """Returns versions of the last change of the validators, `None` for missing ones."""
+        return [self._changes.get(public_key) for public_key in public_keys]
+
+    def load(self, validators: Iterable[Validator]) -> None:
+        for validator in sorted(validators, key=lambda v: v.created_at):
+            self.add(validator)
+
+    def add(self, validator: Validator) -> None:
+        """Adds a new validator or replaces the validator with the same public key."""
+        public_key = validator.public_key
+        if public_key in self._validators:
+            self._unindex(public_key)
+
+        self._sequence += 1
+        index_key = (validator.created_at, self._sequence)
+        self._index.add(index_key)
+        self._index_keys[public_key] = index_key
+        self._public_keys[index_key] = public_key
+        self._validators[public_key] = validator
+        self._removed.pop(public_key, None)
+        self.touch(public_key)
+
+    def touch(self, public_key: HexStr) -> None:
+        """Records a change of the validator's exit signature or shares."""
+        if public_key not in self._validators:
+            # removed by cleanup while the exit signature was processed
+            return
+        validator = self._validators[public_key]
+        validator.response_fragments.clear()
+        if validator.exit_signature is None:
+            self._not_ready_index.add(self._index_keys[public_key])
+        else:
+            self._not_ready_index.discard(self._index_keys[public_key])
+        self.version += 1
+        self._changes[public_key] = self.version
+        self._changes.move_to_end(public_key)
+
+    def pop(self, public_key: HexStr) -> Validator:
+        validator = self._validators.pop(public_key)
+        self._unindex(public_key)
+        del self._changes[public_key]
+
+        self.version += 1
+        self._removed[public_key] = self.version
+        if len(self._removed) > self.max_removed:
+            _, self._min_version = self._removed.popitem(last=False)
+        return validator
+
+    # pylint: disable-next=too-many-arguments
+    def get_page(
+        self,
+        *,
+        cursor: tuple[int, int] | None = None,
+        limit: int | None = None,
+        created_since: int | None = None,
+        predicate: Callable[[Validator], bool] | None = None,
+        is_ready: bool | None = None,
+    ) -> tuple[list[Validator], tuple[int, int] | None]:
+        """
+        Returns validators in creation order after the cursor
+        and the cursor of the next page, `None` for the last page.
+        Page of not ready validators scans only them, other pages scan all validators.
+        """
+        index = self._not_ready_index if is_ready is False else self._index
+        page: list[Validator] = []
+        for index_key in index.iter_from(cursor, created_since):
+            validator = self._validators[self._public_keys[index_key]]
+            if is_ready and validator.exit_signature is None:
+                continue
+            if predicate is not None and not predicate(validator):
+                continue
+            if limit is not None and len(page) == limit:
+                return page, self._index_keys[page[-1].public_key]
+            page.append(validator)
+        return page, None
+
+    def get_changes(
+        self,
+        since_version: int,
+        limit: int | None = None,
+    ) -> tuple[list[Validator], list[HexStr], int]:
+        """
+        Returns validators changed and public keys removed after `since_version`
+        in the order of changes, and the version the result is consistent with.
+        """
+        if since_version < self._min_version:
+            raise VersionTooOldError(f'version {since_version} is too old')
+
+        changed = _take_newer(self._changes, since_version)
+        version = self.version
+        if limit is not None and len(changed) > limit:
+            changed = changed[:limit]
+            version = self._changes[changed[-1]]
+
+        removed = [
+            public_key
+            for public_key in _take_newer(self._removed, since_version)
+            if self._removed[public_key] <= version
+        ]
+        return [self._validators[public_key] for public_key in changed], removed, version
+
+    def _unindex(self, public_key: HexStr) -> None:
+        index_key = self._index_keys.pop(public_key)
+        del self._public_keys[index_key]
+        self._index.discard(index_key)
+        self._not_ready_index.discard(index_key)
+
+
+def _take_newer(versions: 'OrderedDict[HexStr, int]', since_version: int) -> list[HexStr]:
+    """Public keys with version greater than `since_version`, ordered by version."""
+    public_keys = []
+    for public_key in reversed(versions):
+        if versions[public_key] <= since_version:
+            break
+        public_keys.append(public_key)
+    public_keys.reverse()
+    return public_keys
@@ -1,18 +1,27 @@
 import logging
+from pathlib import Path
 from time import time
 
-from eth_typing import BlockNumber
-from sw_utils import EventScanner, IpfsFetchClient
-from web3 import Web3
+from sw_utils import EventScanner
 
 from src.app_state import AppState
-from src.common.checks import wait_execution_catch_up_consensus
-from src.common.consensus import get_chain_finalized_head
-from src.common.tasks import BaseTask
+from src.common.clients import db_client
+from src.common.tasks import BaseTask, PeriodicTask
+from src.common.typings import ChainHeads
 from src.config import settings
-from src.validators.database import NetworkValidatorCrud
-from src.validators.execution import NetworkValidatorsProcessor
-from src.validators.typings import NetworkValidator
+from src.validators.database import AsyncNetworkValidatorCrud
+from src.validators.execution import (
+    NetworkValidatorsProcessor,
+    refresh_network_validators_tail,
+    update_network_validators_tail,
+)
+from src.validators.exit_messages import exit_message_cache
+from src.validators.genesis import (
+    iter_genesis_validator_batches,
+    stream_genesis_validators,
+)
+from src.validators.journal import validators_journal
+from src.validators.snapshot import import_validators_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -22,46 +31,94 @@ class NetworkValidatorsTask(BaseTask):
         network_validators_processor = NetworkValidatorsProcessor()
         self.network_validators_scanner = EventScanner(network_validators_processor)
 
-    async def process_block(self) -> None:
-        chain_state = await get_chain_finalized_head()
-        await wait_execution_catch_up_consensus(chain_state=chain_state)
-
+    async def process_block(self, chain_heads: ChainHeads) -> None:
         # process new network validators
-        await self.network_validators_scanner.process_new_events(chain_state.block_number)
+        await self.network_validators_scanner.process_new_events(chain_heads.finalized.block_number)
+
+
+class NetworkValidatorsTailTask(BaseTask):
+    async def process_block(self, chain_heads: ChainHeads) -> None:
+        # unfinalized validators, used to calculate validators start index
+        await update_network_validators_tail(chain_heads.execution_block)
+
+    def process_unchanged_heads(self, chain_heads: ChainHeads) -> None:
+        # missed slots don't make the tail stale while the nodes are available
+        refresh_network_validators_tail(chain_heads.execution_block)
+
+
+async def load_validators_snapshot() -> None:
+    """
+    Load network validators from the local snapshot file.
+    Skipped if network validators are already saved.
+    """
+    if not settings.validators_snapshot_file:
+        return
+
+    if await AsyncNetworkValidatorCrud().get_last_network_validator() is not None:
+        logger.info('Network validators are already saved, skipping snapshot')
+        return
+
+    logger.info('Loading network validators snapshot...')
+    path = Path(settings.validators_snapshot_file)
+    header = await db_client.write(import_validators_snapshot, path)
+    logger.info(
+        'Loaded %d network validators up to block %d',
+        header.validators_count,
+        header.last_block_number,
+    )
 
 
 async def load_genesis_validators() -> None:
     """
     Load consensus network validators from the ipfs dump.
-    Used to speed up service startup
+    Used to speed up service startup.
+    The dump is streamed and saved in batches, interrupted load starts over on restart.
     """
     ipfs_hash = settings.network_config.GENESIS_VALIDATORS_IPFS_HASH
-    if not (NetworkValidatorCrud().get_last_network_validator() is None and ipfs_hash):
+    if not ipfs_hash:
+        return
+
+    crud = AsyncNetworkValidatorCrud()
+    is_loaded = await crud.get_genesis_validators_loaded()
+    if is_loaded or (is_loaded is None and await crud.get_last_network_validator() is not None):
         return
 
-    ipfs_fetch_client = IpfsFetchClient(
-        ipfs_endpoints=settings.ipfs_fetch_endpoints,
-        timeout=settings.genesis_validators_ipfs_timeout,
-        retry_timeout=settings.genesis_validators_ipfs_retry_timeout,
-    )
-    logger.info('Fetching genesis validators...')
-    data = await ipfs_fetch_client.fetch_bytes(ipfs_hash)
-    genesis_validators: list[NetworkValidator] = []
     logger.info('Loading genesis validators...')
-    for i in range(0, len(data), 52):
-        genesis_validators.append(
-            NetworkValidator(
-                public_key=Web3.to_hex(data[i + 4 : i + 52]),
-                block_number=BlockNumber(int.from_bytes(data[i : i + 4], 'big')),
-            )
+    await crud.set_genesis_validators_loaded(ipfs_hash, False)
+    await db_client.write(db_client.set_bulk_load, True)
+    try:
+        validators_count = 0
+        start_time = time()
+        chunks = stream_genesis_validators(
+            ipfs_hash,
+            ipfs_endpoints=settings.ipfs_fetch_endpoints,
+            timeout=settings.genesis_validators_ipfs_timeout,
+            retry_timeout=settings.genesis_validators_ipfs_retry_timeout,
         )
+        async for rows in iter_genesis_validator_batches(
+            chunks, settings.genesis_validators_batch_size
+        ):
+            await crud.save_network_validator_rows(rows)
+            validators_count += len(rows)
+            logger.info(
+                'Loaded %d genesis validators, %.0f validators/s',
+                validators_count,
+                validators_count / max(time() - start_time, 1e-6),
+            )
+    finally:
+        await db_client.write(db_client.set_bulk_load, False)
 
-    NetworkValidatorCrud().save_network_validators(genesis_validators)
-    logger.info('Loaded %d genesis validators', len(genesis_validators))
+    await crud.set_genesis_validators_loaded(ipfs_hash, True)
+    logger.info('Loaded %d genesis validators', validators_count)
 
 
-class CleanupValidatorsTask(BaseTask):
-    async def process_block(self) -> None:
+class CleanupValidatorsTask(PeriodicTask):
+    """Cleanup doesn't depend on the chain, it runs even if the heads aren't updated."""
+
+    def __init__(self) -> None:
+        super().__init__(interval=settings.network_config.SECONDS_PER_BLOCK)
+
+    async def process(self) -> None:
         app_state = AppState()
         public_keys = []
         now = int(time())
@@ -69,6 +126,15 @@ class CleanupValidatorsTask(BaseTask):
             if now - validator.created_at > settings.VALIDATOR_LIFETIME:
                 public_keys.append(public_key)
 
+        removed_indexes = set()
         for public_key in public_keys:
             logger.info('Cleanup validator %s', public_key)
-            del app_state.validators[public_key]
+            removed_indexes.add(app_state.validators.pop(public_key).validator_index)
+
+        if removed_indexes:
+            # validator index may be reused by the remaining validators
+            exit_message_cache.evict(
+                removed_indexes - {v.validator_index for v in app_state.validators.values()}
+            )
+
+        validators_journal.compact_if_needed(app_state.validators.values())
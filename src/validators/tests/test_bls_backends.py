@@ -0,0 +1,151 @@
+import pytest
+from py_ecc.bls import G2ProofOfPossession
+
+from src.validators.bls_backends import (
+    BLS_BACKEND_ARKWORKS,
+    BLS_BACKEND_PY_ECC,
+    BLSBackend,
+    PyEccBLSBackend,
+    get_bls_backend,
+    verify_signatures,
+)
+from src.validators.key_shares import (
+    bls_signature_and_public_key_to_shares,
+    bls_signature_and_public_key_to_shares_with_coefficients,
+    reconstruct_shared_bls_signature,
+)
+
+PRIVATE_KEY = 0x2A9B3F0C1E4D5A6B7C8D9E0F1A2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C4D
+MESSAGE = b'\x42' * 32
+COEFFICIENTS = [
+    0x1D3A6B5F2E4C7A9B8C1D2E3F4A5B6C7D8E9FA0B1C2D3E4F5061728394A5B6C7D,
+    0x5E6F708192A3B4C5D6E7F8091A2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C,
+]
+TOTAL = 5
+
+public_key = G2ProofOfPossession.SkToPk(PRIVATE_KEY)
+signature = G2ProofOfPossession.Sign(PRIVATE_KEY, MESSAGE)
+
+
+def available_backends() -> list:
+    backends = [get_bls_backend(BLS_BACKEND_PY_ECC)]
+    try:
+        backends.append(get_bls_backend(BLS_BACKEND_ARKWORKS))
+    except RuntimeError:
+        pass
+    return backends
+
+
+@pytest.fixture(params=available_backends(), ids=lambda backend: backend.name)
+def backend(request):
+    return request.param
+
+
+def test_shares_are_verifiable(backend):
+    signature_shares, public_key_shares = bls_signature_and_public_key_to_shares(
+        MESSAGE, signature, public_key, threshold=3, total=TOTAL, backend=backend
+    )
+
+    assert len(signature_shares) == len(public_key_shares) == TOTAL
+    for signature_share, public_key_share in zip(signature_shares, public_key_shares):
+        assert G2ProofOfPossession.Verify(public_key_share, MESSAGE, signature_share)
+
+
+def test_reconstruct(backend):
+    signature_shares, _ = bls_signature_and_public_key_to_shares(
+        MESSAGE, signature, public_key, threshold=3, total=TOTAL, backend=backend
+    )
+
+    shares = {1: signature_shares[0], 3: signature_shares[2], 5: signature_shares[4]}
+    assert reconstruct_shared_bls_signature(shares, backend=backend) == signature
+
+
+def test_backends_equivalence():
+    backends = available_backends()
+    if len(backends) < 2:
+        pytest.skip('compiled BLS backend is not installed')
+
+    results = [
+        bls_signature_and_public_key_to_shares_with_coefficients(
+            MESSAGE, signature, public_key, COEFFICIENTS, TOTAL, backend=backend
+        )
+        for backend in backends
+    ]
+    assert all(result == results[0] for result in results)
+
+    signature_shares = results[0][0]
+    for indexes in ([1, 2, 3], [2, 4, 5], [1, 2, 3, 4, 5]):
+        shares = {i: signature_shares[i - 1] for i in indexes}
+        reconstructed = [
+            reconstruct_shared_bls_signature(shares, backend=backend) for backend in backends
+        ]
+        assert reconstructed == [signature] * len(backends)
+
+
+def test_batch_verify():
+    backends = [backend for backend in available_backends() if backend.batch_verify_supported]
+    if not backends:
+        pytest.skip('BLS backend with batch verification is not installed')
+
+    private_keys = [PRIVATE_KEY + i for i in range(3)]
+    messages = [bytes([i]) * 32 for i in range(3)]
+    public_keys = [G2ProofOfPossession.SkToPk(sk) for sk in private_keys]
+    signatures = [G2ProofOfPossession.Sign(sk, m) for sk, m in zip(private_keys, messages)]
+
+    for backend in backends:
+        assert backend.batch_verify(public_keys, messages, signatures)
+        assert not backend.batch_verify(public_keys, messages, list(reversed(signatures)))
+        assert not backend.batch_verify(public_keys, list(reversed(messages)), signatures)
+
+
+class BatchPyEccBLSBackend(PyEccBLSBackend):
+    """Batch verification through the base class, available without compiled backend."""
+
+    batch_verify_supported = True
+
+    def __init__(self) -> None:
+        self.batch_calls = 0
+
+    def batch_verify(self, *args, **kwargs) -> bool:
+        self.batch_calls += 1
+        return BLSBackend.batch_verify(self, *args, **kwargs)
+
+
+@pytest.fixture(
+    params=[BatchPyEccBLSBackend()]
+    + [backend for backend in available_backends() if backend.batch_verify_supported],
+    ids=lambda backend: type(backend).__name__,
+)
+def batch_backend(request):
+    return request.param
+
+
+def test_verify_signatures_finds_invalid_signature(batch_backend):
+    private_keys = [PRIVATE_KEY + i for i in range(4)]
+    messages = [bytes([i]) * 32 for i in range(4)]
+    public_keys = [G2ProofOfPossession.SkToPk(sk) for sk in private_keys]
+    signatures = [G2ProofOfPossession.Sign(sk, m) for sk, m in zip(private_keys, messages)]
+    messages_g2 = [batch_backend.G2_to_signature(batch_backend.hash_to_G2(m)) for m in messages]
+
+    assert (
+        verify_signatures(public_keys, messages, signatures, messages_g2, backend=batch_backend)
+        == [True] * 4
+    )
+
+    signatures[2] = signatures[1]
+    assert verify_signatures(
+        public_keys, messages, signatures, messages_g2, backend=batch_backend
+    ) == [True, True, False, True]
+
+    if isinstance(batch_backend, BatchPyEccBLSBackend):
+        assert batch_backend.batch_calls == 2
+
+
+def test_shares_with_precomputed_message_g2(backend):
+    message_g2 = backend.G2_to_signature(backend.hash_to_G2(MESSAGE))
+
+    assert bls_signature_and_public_key_to_shares_with_coefficients(
+        MESSAGE, signature, public_key, COEFFICIENTS, TOTAL, message_g2=message_g2, backend=backend
+    ) == bls_signature_and_public_key_to_shares_with_coefficients(
+        MESSAGE, signature, public_key, COEFFICIENTS, TOTAL, backend=backend
+    )
@@ -0,0 +1,39 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from src.validators.genesis import (
+    GENESIS_VALIDATOR_RECORD_SIZE,
+    iter_genesis_validator_batches,
+)
+
+
+def get_dump(count: int) -> bytes:
+    return b''.join(i.to_bytes(4, 'big') + bytes([i % 256]) * 48 for i in range(count))
+
+
+async def iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+async def collect_batches(data: bytes, chunk_size: int, batch_size: int) -> list[list]:
+    return [
+        batch
+        async for batch in iter_genesis_validator_batches(iter_chunks(data, chunk_size), batch_size)
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, GENESIS_VALIDATOR_RECORD_SIZE, 1000, 10000])
+def test_genesis_validator_batches(chunk_size):
+    batches = asyncio.run(collect_batches(get_dump(25), chunk_size, batch_size=10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    rows = [row for batch in batches for row in batch]
+    assert rows == [(bytes([i % 256]) * 48, i) for i in range(25)]
+
+
+def test_genesis_validator_batches_invalid_size():
+    with pytest.raises(ValueError):
+        asyncio.run(collect_batches(get_dump(3)[:-1], 100, batch_size=10))
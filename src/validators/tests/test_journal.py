@@ -0,0 +1,111 @@
+import stat
+from time import time
+
+from eth_typing import BLSSignature, HexStr
+
+from src.validators.journal import ValidatorsJournal
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+PUBLIC_KEY_1 = HexStr('0x' + '11' * 48)
+PUBLIC_KEY_2 = HexStr('0x' + '22' * 48)
+
+
+def create_journal(tmp_path, compaction_records: int = 1000) -> ValidatorsJournal:
+    journal = ValidatorsJournal()
+    validators = journal.setup(
+        str(tmp_path / 'validators.journal'),
+        validator_lifetime=3600,
+        compaction_records=compaction_records,
+    )
+    assert validators == {}
+    return journal
+
+
+def test_journal_replay(tmp_path):
+    journal = create_journal(tmp_path)
+    now = int(time())
+    validator = Validator(public_key=PUBLIC_KEY_1, validator_index=10, created_at=now)
+    journal.add_validators([validator])
+    validator.exit_signature_shares = {
+        1: BLSSignature(b'\x01' * 96),
+        2: BLSSignature(b'\x02' * 96),
+    }
+    journal.add_exit_signature_shares(
+        (PUBLIC_KEY_1, share_index, share)
+        for share_index, share in validator.exit_signature_shares.items()
+    )
+    validator.exit_signature = BLSSignature(b'\x03' * 96)
+    validator.oracles_exit_signature_shares = OraclesExitSignatureShares(
+        public_keys=[HexStr('0x01')], encrypted_exit_signatures=[HexStr('0x02')]
+    )
+    journal.add_exit_signatures([validator])
+    # expired validator is not restored
+    journal.add_validators(
+        [Validator(public_key=PUBLIC_KEY_2, validator_index=11, created_at=now - 7200)]
+    )
+    journal.close()
+
+    validators = ValidatorsJournal().setup(
+        str(tmp_path / 'validators.journal'), validator_lifetime=3600, compaction_records=1000
+    )
+
+    assert validators == {PUBLIC_KEY_1: validator}
+
+
+def test_journal_replay_replaced_validator(tmp_path):
+    journal = create_journal(tmp_path)
+    now = int(time())
+    validator = Validator(public_key=PUBLIC_KEY_1, validator_index=10, created_at=now)
+    journal.add_validators([validator])
+    replacement = Validator(public_key=PUBLIC_KEY_1, validator_index=11, created_at=now)
+    journal.add_validators([replacement])
+    # signature for the replaced validator is journaled after the replacement
+    validator.exit_signature = BLSSignature(b'\x03' * 96)
+    journal.add_exit_signatures([validator])
+    journal.close()
+
+    validators = ValidatorsJournal.replay(tmp_path / 'validators.journal')
+
+    assert validators == {PUBLIC_KEY_1: replacement}
+
+
+def test_journal_replay_skips_partial_record(tmp_path):
+    journal = create_journal(tmp_path)
+    journal.add_validators(
+        [Validator(public_key=PUBLIC_KEY_1, validator_index=10, created_at=int(time()))]
+    )
+    journal.close()
+    with (tmp_path / 'validators.journal').open('a', encoding='utf-8') as f:
+        f.write('{"type": "validator", "public_k')
+
+    validators = ValidatorsJournal.replay(tmp_path / 'validators.journal')
+
+    assert list(validators) == [PUBLIC_KEY_1]
+
+
+def test_journal_compaction(tmp_path):
+    journal = create_journal(tmp_path, compaction_records=3)
+    validators = [
+        Validator(public_key=PUBLIC_KEY_1, validator_index=10, created_at=int(time())),
+        Validator(public_key=PUBLIC_KEY_2, validator_index=11, created_at=int(time())),
+    ]
+    journal.add_validators(validators)
+    journal.add_validators(validators[:1])
+    journal.compact_if_needed(validators[1:])
+
+    assert journal.records_count == 0
+    journal.close()
+    assert list(ValidatorsJournal.replay(tmp_path / 'validators.journal')) == [PUBLIC_KEY_2]
+
+
+def test_journal_file_permissions(tmp_path):
+    path = tmp_path / 'validators.journal'
+    path.write_text('')
+    path.chmod(0o644)
+    # left by an interrupted compaction
+    (tmp_path / 'validators.journal.tmp').write_text('')
+
+    journal = create_journal(tmp_path)
+    journal.close()
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
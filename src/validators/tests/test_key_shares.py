@@ -0,0 +1,74 @@
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primitives import G1_to_pubkey, G2_to_signature
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.optimized_bls12_381.optimized_curve import (
+    G1,
+    G2,
+    add,
+    curve_order,
+    multiply,
+)
+
+from src.validators.key_shares import (
+    bls_public_key_to_shares,
+    bls_signature_to_shares,
+    get_G12_polynomial_points,
+)
+
+# fixed coefficients, shares must be reproducible
+COEFFICIENTS = [
+    0x1D3A6B5F2E4C7A9B8C1D2E3F4A5B6C7D8E9FA0B1C2D3E4F5061728394A5B6C7D,
+    0x5E6F708192A3B4C5D6E7F8091A2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C,
+    0x2B3C4D5E6F708192A3B4C5D6E7F8091A2B3C4D5E6F708192A3B4C5D6E7F809,
+]
+
+
+def get_G12_polynomial_points_reference(coefficients: list, num_points: int) -> list:
+    """Straightforward evaluation with full-size scalar multiplications."""
+    points = []
+    for x in range(1, num_points + 1):
+        y = coefficients[0]
+        for i in range(1, len(coefficients)):
+            y = add(y, multiply(coefficients[i], (x**i) % curve_order))
+        points.append(y)
+    return points
+
+
+def test_polynomial_points_g1():
+    coefficients = [multiply(G1, c) for c in COEFFICIENTS]
+    expected = get_G12_polynomial_points_reference(coefficients, 7)
+    points = get_G12_polynomial_points(coefficients, 7)
+
+    assert [G1_to_pubkey(p) for p in points] == [G1_to_pubkey(p) for p in expected]
+
+
+def test_polynomial_points_g2():
+    coefficients = [multiply(G2, c) for c in COEFFICIENTS]
+    expected = get_G12_polynomial_points_reference(coefficients, 7)
+    points = get_G12_polynomial_points(coefficients, 7)
+
+    assert [G2_to_signature(p) for p in points] == [G2_to_signature(p) for p in expected]
+
+
+def test_polynomial_points_single_coefficient():
+    points = get_G12_polynomial_points([G1], 3)
+
+    assert [G1_to_pubkey(p) for p in points] == [G1_to_pubkey(G1)] * 3
+
+
+def test_shares_are_verifiable():
+    private_key = 42
+    message = b'\x11' * 32
+    public_key = G2ProofOfPossession.SkToPk(private_key)
+    signature = G2ProofOfPossession.Sign(private_key, message)
+    message_g2 = hash_to_G2(message, G2ProofOfPossession.DST, G2ProofOfPossession.xmd_hash_function)
+
+    signature_shares = bls_signature_to_shares(
+        signature, [multiply(message_g2, c) for c in COEFFICIENTS], 5
+    )
+    public_key_shares = bls_public_key_to_shares(
+        public_key, [multiply(G1, c) for c in COEFFICIENTS], 5
+    )
+
+    for signature_share, public_key_share in zip(signature_shares, public_key_shares):
+        assert G2ProofOfPossession.Verify(public_key_share, message, signature_share)
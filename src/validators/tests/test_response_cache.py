@@ -0,0 +1,33 @@
+from eth_typing import BLSSignature, HexStr
+
+from src.validators.response_cache import ValidatorsResponseCache
+from src.validators.store import ValidatorsStore
+from src.validators.typings import Validator
+
+PUBLIC_KEYS = [HexStr('0x' + '11' * 48), HexStr('0x' + '22' * 48)]
+
+
+def test_response_cache():
+    store = ValidatorsStore()
+    store.load(
+        Validator(public_key=public_key, validator_index=10 + i, created_at=1000)
+        for i, public_key in enumerate(PUBLIC_KEYS)
+    )
+    cache = ValidatorsResponseCache(max_size=1)
+    cache.put(PUBLIC_KEYS, 10, store, b'response')
+
+    assert cache.get(PUBLIC_KEYS, 10, store) == b'response'
+    # new deposit
+    assert cache.get(PUBLIC_KEYS, 11, store) is None
+
+    # new exit signature share
+    validator = store.get(PUBLIC_KEYS[1])
+    assert validator is not None
+    validator.exit_signature_shares[1] = BLSSignature(b'\x01' * 96)
+    store.touch(validator.public_key)
+    assert cache.get(PUBLIC_KEYS, 10, store) is None
+
+    cache.put(PUBLIC_KEYS, 10, store, b'response')
+    cache.put(PUBLIC_KEYS[:1], 10, store, b'response')
+    assert cache.get(PUBLIC_KEYS, 10, store) is None
+    assert (cache.hits, cache.misses) == (1, 3)
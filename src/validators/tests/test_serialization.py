@@ -0,0 +1,87 @@
+import pytest
+from eth_typing import BLSSignature, HexStr
+
+from src.validators import serialization
+from src.validators.schema import (
+    CreateValidatorsResponse,
+    CreateValidatorsResponseItem,
+    ExitsResponse,
+    ExitsResponseItem,
+)
+from src.validators.serialization import (
+    serialize_create_validators_response,
+    serialize_exits_response,
+)
+from src.validators.store import ValidatorsStore
+from src.validators.typings import OraclesExitSignatureShares, Validator
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'json'], autouse=True)
+def json_encoder(request, monkeypatch):
+    if request.param and not serialization.ORJSON_INSTALLED:
+        pytest.skip('orjson is not installed')
+    monkeypatch.setattr(serialization, 'ORJSON_INSTALLED', request.param)
+
+
+def create_validators() -> list[Validator]:
+    return [
+        Validator(public_key=HexStr('0x' + '11' * 48), validator_index=10, created_at=1700000000),
+        Validator(
+            public_key=HexStr('0x' + '22' * 48),
+            validator_index=11,
+            created_at=1700000001,
+            exit_signature=BLSSignature(b'\x01' * 96),
+            exit_signature_shares={3: BLSSignature(b'\x03' * 96), 1: BLSSignature(b'\x01' * 96)},
+            oracles_exit_signature_shares=OraclesExitSignatureShares(
+                public_keys=[HexStr('0x01'), HexStr('0x02')],
+                encrypted_exit_signatures=[HexStr('0x03'), HexStr('0x04')],
+            ),
+        ),
+    ]
+
+
+def test_create_validators_response_matches_schema():
+    validators = create_validators()
+    expected = CreateValidatorsResponse(
+        ready=False,
+        validators=[CreateValidatorsResponseItem.from_validator(v) for v in validators],
+    ).model_dump_json()
+
+    assert serialize_create_validators_response(False, validators).decode() == expected
+    assert serialize_create_validators_response(True, []).decode() == (
+        CreateValidatorsResponse(ready=True, validators=[]).model_dump_json()
+    )
+
+
+def test_exits_response_matches_schema():
+    validators = create_validators()
+    expected = ExitsResponse(
+        exits=[ExitsResponseItem.from_validator(v) for v in validators],
+        next_cursor='1700000001-2',
+        version=5,
+        removed_public_keys=[HexStr('0x' + '33' * 48)],
+    ).model_dump_json()
+
+    assert (
+        serialize_exits_response(
+            validators,
+            next_cursor='1700000001-2',
+            version=5,
+            removed_public_keys=[HexStr('0x' + '33' * 48)],
+        ).decode()
+        == expected
+    )
+
+
+def test_fragment_invalidated_on_change():
+    store = ValidatorsStore()
+    validator = create_validators()[0]
+    store.add(validator)
+    serialize_exits_response([validator], None, store.version, [])
+
+    validator.exit_signature_shares[2] = BLSSignature(b'\x02' * 96)
+    store.touch(validator.public_key)
+
+    assert b'"share_indexes_ready":[2]' in serialize_exits_response(
+        [validator], None, store.version, []
+    )
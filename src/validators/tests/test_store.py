@@ -0,0 +1,92 @@
+import pytest
+from eth_typing import BLSSignature, HexStr
+
+from src.validators.store import ValidatorsStore, VersionTooOldError
+from src.validators.typings import Validator
+
+
+def create_validator(i: int, created_at: int = 1000) -> Validator:
+    return Validator(public_key=HexStr(f'0x{i:096x}'), validator_index=i, created_at=created_at + i)
+
+
+def test_store_pages():
+    store = ValidatorsStore()
+    validators = [create_validator(i) for i in range(10)]
+    store.load(reversed(validators))
+    store.pop(validators[3].public_key)
+
+    page, cursor = store.get_page(limit=4)
+    assert page == [validators[i] for i in (0, 1, 2, 4)]
+
+    page, cursor = store.get_page(cursor=cursor, limit=4)
+    assert page == validators[5:9]
+
+    page, cursor = store.get_page(cursor=cursor, limit=4)
+    assert page == validators[9:]
+    assert cursor is None
+
+    page, cursor = store.get_page(created_since=1007)
+    assert page == validators[7:]
+
+
+def test_store_page_filter():
+    store = ValidatorsStore()
+    validators = [create_validator(i) for i in range(10)]
+    store.load(validators)
+    for v in validators[::2]:
+        v.exit_signature = BLSSignature(b'\x01' * 96)
+
+    page, cursor = store.get_page(limit=3, predicate=lambda v: v.exit_signature is None)
+
+    assert page == [validators[i] for i in (1, 3, 5)]
+    assert store.get_page(cursor=cursor, predicate=lambda v: v.exit_signature is None) == (
+        [validators[i] for i in (7, 9)],
+        None,
+    )
+
+
+def test_store_not_ready_pages():
+    store = ValidatorsStore()
+    validators = [create_validator(i) for i in range(6)]
+    store.load(validators)
+    for v in validators[:4]:
+        v.exit_signature = BLSSignature(b'\x01' * 96)
+        store.touch(v.public_key)
+    # replaced validator has no exit signature
+    store.add(create_validator(0, created_at=2000))
+
+    page, cursor = store.get_page(limit=2, is_ready=False)
+    assert page == validators[4:]
+
+    page, cursor = store.get_page(cursor=cursor, is_ready=False)
+    assert page == [create_validator(0, created_at=2000)]
+    assert cursor is None
+
+    page, cursor = store.get_page(is_ready=True)
+    assert page == validators[1:4]
+
+
+def test_store_changes():
+    store = ValidatorsStore(max_removed=1)
+    validators = [create_validator(i) for i in range(3)]
+    store.load(validators)
+    version = store.version
+
+    store.touch(validators[0].public_key)
+    store.pop(validators[1].public_key)
+    store.add(create_validator(4))
+
+    changed, removed, new_version = store.get_changes(version)
+    assert changed == [validators[0], create_validator(4)]
+    assert removed == [validators[1].public_key]
+    assert new_version == store.version
+
+    changed, removed, new_version = store.get_changes(version, limit=1)
+    assert changed == [validators[0]]
+    assert removed == []
+    assert new_version == version + 1
+
+    # the oldest removal is dropped
+    store.pop(validators[2].public_key)
+    with pytest.raises(VersionTooOldError):
+        store.get_changes(version)
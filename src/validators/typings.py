@@ -9,6 +9,26 @@ class NetworkValidator:
     block_number: BlockNumber
 
 
+# raw public key and deposit block number, used for bulk saving
+NetworkValidatorRow = tuple[bytes, BlockNumber]
+
+
+@dataclass
+class NetworkValidatorsTail:
+    """
+    Valid public keys deposited after the last saved network validator,
+    up to the latest execution block.
+    """
+
+    from_block: BlockNumber
+    to_block: BlockNumber
+    # used to detect chain reorgs
+    to_block_hash: HexStr
+    # public key -> deposit block number
+    public_keys: dict[HexStr, BlockNumber]
+    updated_at: float
+
+
 @dataclass
 class OraclesExitSignatureShares:
     public_keys: list[HexStr]
@@ -27,3 +47,6 @@ class Validator:
 
     # Oracles' shares
     oracles_exit_signature_shares: OraclesExitSignatureShares | None = None
+
+    # serialized response items, cleared on every change in `ValidatorsStore`
+    response_fragments: dict[str, bytes] = field(default_factory=dict, repr=False, compare=False)